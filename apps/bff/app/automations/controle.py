@@ -16,8 +16,10 @@ Segurança
 
 Compatibilidade
 ---------------
-- Integra com a camada `app.db` e tolera variações de assinatura mais antigas
-  (ex.: `list_audits()` sem parâmetros), mantendo *fallbacks* quando necessário.
+- Integra com a camada `app.db`; filtros e paginação dos audits são aplicados
+  no SQL (paginação *keyset* via `cursor`/`next_cursor`, `offset` mantido).
+- Respostas JSON usam `ORJSONResponse`; as listagens/detalhe devolvem a resposta
+  já pronta, sem passar pelo `jsonable_encoder` do FastAPI.
 
 Endpoints
 ---------
@@ -30,7 +32,7 @@ Metadados
 Auditoria
 - GET /api/automations/controle/actions           (listar ações distintas)
 - GET /api/automations/controle/kinds             (listar alvos/kinds distintos)
-- GET /api/automations/controle/audits            (lista paginada)
+- GET /api/automations/controle/audits            (lista paginada por cursor)
 - GET /api/automations/controle/audits.csv        (exportação CSV)
 
 Submissões
@@ -44,16 +46,19 @@ Não suportado (somente leitura)
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import io
-import json
 import logging
-from datetime import datetime
+import os
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypeVar, Generic
+from typing import Any, AsyncIterator, Dict, List, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -73,28 +78,38 @@ AUTOMATION_META = {
     "readOnly": True,
 }
 
-_CONTROL_ALLOWED_ROLES = {
+_CONTROL_ALLOWED_ROLES = frozenset({
     "admin",
     *{str(role).strip().lower() for role in tasks_automation._load_role_options()},
-}
+})
 
 def require_admin_coord_or_superuser(request: Request) -> Dict[str, Any]:
     """
     Autoriza se o usuário for superuser ou tiver papel elegível no Painel de Controle.
     """
     user = require_password_changed(request)
-    roles = {str(role).strip().lower() for role in (user.get("roles") or []) if str(role).strip()}
-    if user.get("is_superuser") is True or not roles.isdisjoint(_CONTROL_ALLOWED_ROLES):
+    if user.get("is_superuser") is True:
         return user
+    for role in user.get("roles") or ():
+        if str(role).strip().lower() in _CONTROL_ALLOWED_ROLES:
+            return user
     raise HTTPException(status_code=403, detail="forbidden")
 
 router = APIRouter(
     prefix=f"/api/automations/{KIND}",
     tags=["automations", "controle"],
     dependencies=[Depends(require_admin_coord_or_superuser)],
+    default_response_class=ORJSONResponse,
 )
 
 templates = Jinja2Templates(directory=str(Path(__file__).parent / "templates"))
+# Fora de `dev` o template não muda em runtime: é resolvido uma vez e sem o `stat` de
+# verificação a cada render. Em `dev` é buscado por requisição, para que o
+# `auto_reload` do Jinja recarregue edições sem reiniciar o processo.
+_TEMPLATES_DEV = os.getenv("ENV", "dev") == "dev"
+templates.env.auto_reload = _TEMPLATES_DEV
+_UI_TEMPLATE_NAME = "controle/ui.html"
+_UI_TEMPLATE = None if _TEMPLATES_DEV else templates.env.get_template(_UI_TEMPLATE_NAME)
 
 
 class AuditOut(BaseModel):
@@ -178,23 +193,40 @@ class SubmissionOut(BaseModel):
     error: Optional[Any] = None
 
 
-T = TypeVar("T")
+class AuditPage(BaseModel):
+    """
+    Página de auditorias (`/audits`).
+
+    Campos
+    ------
+    count : int | None
+        Total de itens após filtro no servidor (`None` em páginas seguintes de
+        paginação por cursor, quando o total já é conhecido pelo cliente).
+    items : List[AuditOut]
+        Página de resultados.
+    next_cursor : str | None
+        Cursor opaco para a próxima página (paginação *keyset*), quando houver.
+    """
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+    count: Optional[int] = None
+    items: List[AuditOut]
+    next_cursor: Optional[str] = None
 
 
-class Page(BaseModel, Generic[T]):
+class SubmissionPage(BaseModel):
     """
-    Envelope de paginação genérico.
+    Página de submissões (`/submissions`).
 
     Campos
     ------
     count : int
-        Total de itens após filtro/paginação no servidor.
-    items : List[T]
-        Página de resultados.
+        Total de itens após filtro no servidor.
+    items : List[SubmissionOut]
+        Página de resultados (sem `payload`/`result`).
     """
     model_config = ConfigDict(populate_by_name=True, extra="ignore")
     count: int
-    items: List[T]
+    items: List[SubmissionOut]
 
 
 @router.get("/ui", response_class=HTMLResponse)
@@ -202,98 +234,96 @@ def get_ui(request: Request):
     """
     Renderiza a UI HTML principal do painel (carregada via iframe pelo host).
     """
-    return templates.TemplateResponse("controle/ui.html", {"request": request})
+    tpl = _UI_TEMPLATE or templates.env.get_template(_UI_TEMPLATE_NAME)
+    return HTMLResponse(tpl.render(request=request))
+
+
+_SCHEMA: Dict[str, Any] = {
+    "name": KIND,
+    "version": CONTROLE_VERSION,
+    "title": TITLE,
+    "filters": {
+        "kind": {"type": "string", "description": "Opcional: filtra por automação de origem (alvo)"},
+        "username": {"type": "string"},
+        "action": {"type": "string"},
+        "since": {"type": "datetime"},
+        "until": {"type": "datetime"},
+        "limit": {"type": "integer", "minimum": 1, "maximum": 1000, "default": 100},
+        "offset": {"type": "integer", "minimum": 0, "default": 0},
+    },
+    "notes": (
+        "Painel de controle em modo somente leitura para auditoria e consulta. "
+        "Os módulos especializados podem oferecer exportações próprias, como o compilado semanal de tarefas."
+    ),
+}
 
 
 @router.get("/schema")
 def get_schema():
     """
     Retorna metadados informativos sobre filtros/limites aceitos pelos endpoints.
+    O conteúdo é estático e montado uma única vez na importação do módulo.
     """
-    return {
-        "name": KIND,
-        "version": CONTROLE_VERSION,
-        "title": TITLE,
-        "filters": {
-            "kind": {"type": "string", "description": "Opcional: filtra por automação de origem (alvo)"},
-            "username": {"type": "string"},
-            "action": {"type": "string"},
-            "since": {"type": "datetime"},
-            "until": {"type": "datetime"},
-            "limit": {"type": "integer", "minimum": 1, "maximum": 1000, "default": 100},
-            "offset": {"type": "integer", "minimum": 0, "default": 0},
-        },
-        "notes": (
-            "Painel de controle em modo somente leitura para auditoria e consulta. "
-            "Os módulos especializados podem oferecer exportações próprias, como o compilado semanal de tarefas."
-        ),
-    }
+    return _SCHEMA
 
 
-def _filter_dates(
-    items: List[Dict[str, Any]],
-    since: Optional[datetime],
-    until: Optional[datetime],
-    key_candidates=("ts", "created_at", "updated_at"),
-):
+def _as_utc(dt: datetime) -> datetime:
     """
-    Filtra uma lista de registros por intervalo temporal, tentando múltiplas chaves de data.
-
-    Regras
-    ------
-    - Aceita valores `datetime` ou strings ISO (com suporte a 'Z').
-    - Inclui apenas itens com datas entre `since` e `until` (se informados).
+    Garante `datetime` timezone-aware; valores *naive* são interpretados como UTC.
     """
-    def pick_dt(row):
-        for k in key_candidates:
-            v = row.get(k)
-            if isinstance(v, str):
-                try:
-                    return datetime.fromisoformat(v.replace("Z", "+00:00"))
-                except Exception:
-                    continue
-            if isinstance(v, datetime):
-                return v
-        return None
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
 
-    out = []
-    for it in items:
-        dt = pick_dt(it)
-        if since and dt and dt < since:
-            continue
-        if until and dt and dt > until:
-            continue
-        out.append(it)
-    return out
+
+def _parse_ts(v: Any) -> Optional[datetime]:
+    """
+    Converte um timestamp (`datetime` ou string ISO, com suporte a 'Z') em `datetime` UTC-aware.
+    Retorna `None` quando não for possível converter.
+    """
+    if isinstance(v, datetime):
+        return _as_utc(v)
+    if isinstance(v, str):
+        if v.endswith("Z"):
+            v = v[:-1] + "+00:00"
+        try:
+            return _as_utc(datetime.fromisoformat(v))
+        except ValueError:
+            return None
+    return None
 
 
 def _to_obj(x: Any) -> Dict[str, Any]:
     """
     Converte `x` em `dict`, aceitando `bytes`, `str` (JSON) ou já `dict`.
     Retorna `{}` quando não for possível converter.
+
+    Observação
+    ----------
+    Colunas JSONB já chegam como `dict` (decodificadas com orjson em `app.db`);
+    o caminho de parse só atende valores legados em texto/bytes.
     """
-    if x is None:
-        return {}
     if isinstance(x, dict):
         return x
-    if isinstance(x, (bytes, bytearray)):
-        try:
-            return json.loads(x.decode("utf-8"))
-        except Exception:
-            return {}
-    if isinstance(x, str):
-        try:
-            return json.loads(x)
-        except Exception:
-            return {}
-    return {}
+    if not x:
+        return {}
+    try:
+        return orjson.loads(x)
+    except Exception:
+        return {}
 
 
-def _digits(s: Optional[str]) -> str:
-    """
-    Mantém apenas dígitos de uma string (útil para busca por CPF).
-    """
-    return "".join(ch for ch in str(s or "") if ch.isdigit())
+_KNOWN_ACTIONS = frozenset({"completed", "running", "submitted", "failed", "download", "deleted"})
+_STATUS_MAP = {
+    "done": "completed",
+    "ok": "completed",
+    "success": "completed",
+    "processing": "running",
+    "in_progress": "running",
+    "queued": "submitted",
+    "pending": "submitted",
+    "error": "failed",
+    "failed": "failed",
+    "timeout": "failed",
+}
 
 
 def _status_label(action: Optional[str], status: Optional[str]) -> str:
@@ -302,50 +332,37 @@ def _status_label(action: Optional[str], status: Optional[str]) -> str:
 
     Mapeamentos
     -----------
-    - Ações conhecidas: {completed,running,submitted,failed,download}
+    - Ações conhecidas: {completed,running,submitted,failed,download,deleted}
     - Status → rótulos: done/ok/success→completed; processing/in_progress→running;
       queued/pending→submitted; error/failed/timeout→failed.
     """
-    def norm(x: Optional[str]) -> str:
-        return str(x or "").strip().lower()
-
-    a = norm(action)
-    s = norm(status)
-
-    known = {"completed", "running", "submitted", "failed", "download", "deleted"}
-    if a in known:
+    a = str(action).strip().lower() if action else ""
+    if a in _KNOWN_ACTIONS:
         return a
+    s = str(status).strip().lower() if status else ""
+    return _STATUS_MAP.get(s, a or s or "")
 
-    map_status = {
-        "done": "completed",
-        "ok": "completed",
-        "success": "completed",
-        "processing": "running",
-        "in_progress": "running",
-        "queued": "submitted",
-        "pending": "submitted",
-        "error": "failed",
-        "failed": "failed",
-        "timeout": "failed",
-    }
-    if s in map_status:
-        return map_status[s]
 
-    return a or s or ""
+_SID_KEYS = ("sid", "submissionId", "id")
+_PROTOCOLO_KEYS = (
+    "protocolo", "processo", "numero_processo", "n_processo", "num_processo",
+    "process_number", "protocol", "protocol_number", "protocolo_alvo",
+    "processo_alvo", "protocolo_numero", "target_id",
+)
+_FILE_EXTS = (".pdf", ".docx", ".xlsx", ".zip")
 
 
 def _sid_from_audit_row(row: Dict[str, Any]) -> Optional[str]:
     """
     Tenta extrair o submission id (sid) de diferentes campos usuais do audit.
     """
-    extra = row.get("extra") or {}
-    return (
-        (extra.get("sid") if isinstance(extra, dict) else None)
-        or (extra.get("submissionId") if isinstance(extra, dict) else None)
-        or (extra.get("id") if isinstance(extra, dict) else None)
-        or row.get("target_id")
-        or None
-    )
+    extra = row.get("extra")
+    if isinstance(extra, dict):
+        for key in _SID_KEYS:
+            v = extra.get(key)
+            if v:
+                return v
+    return row.get("target_id") or None
 
 
 def _guess_filename(payload: Dict[str, Any], result: Dict[str, Any], extra: Dict[str, Any]) -> str:
@@ -358,11 +375,12 @@ def _guess_filename(payload: Dict[str, Any], result: Dict[str, Any], extra: Dict
         if not isinstance(d, dict):
             return None
         for k, v in d.items():
-            ks = str(k).lower()
-            if ks.startswith("filename") and isinstance(v, str) and v.strip():
-                return v.strip()
-        for _, v in d.items():
-            if isinstance(v, str) and any(v.lower().endswith(ext) for ext in [".pdf", ".docx", ".xlsx", ".zip"]):
+            if isinstance(v, str) and str(k).lower().startswith("filename"):
+                v = v.strip()
+                if v:
+                    return v
+        for v in d.values():
+            if isinstance(v, str) and v.lower().endswith(_FILE_EXTS):
                 return v.strip()
         return None
 
@@ -376,18 +394,12 @@ def _guess_protocolo(payload: Dict[str, Any], result: Dict[str, Any], extra: Dic
     def first_proto(d: Dict[str, Any]) -> Optional[str]:
         if not isinstance(d, dict):
             return None
-        candidates = [
-            "protocolo", "processo", "numero_processo", "n_processo", "num_processo",
-            "process_number", "protocol", "protocol_number", "protocolo_alvo",
-            "processo_alvo", "protocolo_numero",
-        ]
-        for k in candidates:
+        for k in _PROTOCOLO_KEYS:
             v = d.get(k)
-            if isinstance(v, str) and v.strip():
-                return v.strip()
-        v = d.get("target_id")
-        if isinstance(v, str) and v.strip():
-            return v.strip()
+            if isinstance(v, str):
+                v = v.strip()
+                if v:
+                    return v
         return None
 
     return first_proto(result) or first_proto(payload) or first_proto(extra) or ""
@@ -396,41 +408,88 @@ def _guess_protocolo(payload: Dict[str, Any], result: Dict[str, Any], extra: Dic
 def _normalize_kind(kind: Optional[str]) -> Optional[str]:
     """
     Normaliza um `kind` removendo o prefixo `automations/` quando presente.
+
+    Observação
+    ----------
+    A coluna `automation_audits.kind` já é gravada normalizada (ver
+    `db.normalize_audit_kind`); aqui a função só trata parâmetros de consulta e
+    valores vindos de `extra`/submissões.
     """
     if not kind:
         return None
-    k = str(kind).strip().lower()
+    return _normalize_kind_str(str(kind))
+
+
+@lru_cache(maxsize=256)
+def _normalize_kind_str(kind: str) -> Optional[str]:
+    """
+    Núcleo memoizado de `_normalize_kind` (os kinds formam um conjunto pequeno).
+    """
+    k = kind.strip().lower()
     if k.startswith("automations/"):
         k = k.split("/", 1)[1]
     return k or None
 
 
-def _enrich_with_submission(rows: List[Dict[str, Any]]) -> None:
+def _encode_cursor(row: Dict[str, Any]) -> Optional[str]:
+    """
+    Gera o cursor *keyset* (`<ts ISO>|<id>`) a partir do último item de uma página.
+    """
+    ts = row.get("ts")
+    if not isinstance(ts, datetime) or row.get("id") is None:
+        return None
+    return f"{ts.isoformat()}|{row['id']}"
+
+
+def _decode_cursor(cursor: Optional[str]) -> Optional[tuple]:
+    """
+    Converte o cursor recebido em `(datetime, id)`; cursores inválidos geram 400.
+    """
+    if not cursor:
+        return None
+    try:
+        ts_raw, id_raw = cursor.rsplit("|", 1)
+        ts = _parse_ts(ts_raw)
+        if ts is None:
+            raise ValueError(cursor)
+        return _as_utc(ts), int(id_raw)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="cursor inválido")
+
+
+async def _enrich_with_submission(rows: List[Dict[str, Any]]) -> None:
     """
     Enriquecimento *in-place* dos registros de auditoria com dados da submissão:
     - `alvo` (kind normalizado), `protocolo`, `filename`, `status`
     - `download_url`, `submission_url` (controle) e `origin_submission_url` quando inferíveis.
+
+    As submissões referenciadas são carregadas em uma única consulta
+    (`db.get_submissions_bulk_async`), evitando uma ida ao banco por linha.
     """
-    for it in rows:
+    sids = [_sid_from_audit_row(it) for it in rows]
+    try:
+        subs = await db.get_submissions_bulk_async(sid for sid in sids if sid)
+    except Exception:
+        logger.exception("Falha ao carregar submissões dos audits")
+        subs = {}
+
+    for it, sid in zip(rows, sids):
         extra = it.get("extra") or {}
-        sid = _sid_from_audit_row(it)
-        sub = None
-        if sid:
-            try:
-                sub = db.get_submission(sid)
-            except Exception:
-                sub = None
-
-        payload = _to_obj(sub.get("payload")) if sub else {}
-        result = _to_obj(sub.get("result")) if sub else {}
+        sub = subs.get(sid) if sid else None
+
+        if sub:
+            # JSONB já chega como dict (decoder orjson registrado em `app.db`).
+            p = sub.get("payload")
+            payload = p if isinstance(p, dict) else _to_obj(p)
+            r = sub.get("result")
+            result = r if isinstance(r, dict) else _to_obj(r)
+        else:
+            payload, result = {}, {}
         extra_obj = extra if isinstance(extra, dict) else {}
 
-        kind = (
-            it.get("target_kind")
-            or extra_obj.get("kind")
-            or (sub.get("kind") if sub else None)
+        alvo = it.get("target_kind") or _normalize_kind(
+            extra_obj.get("kind") or (sub.get("kind") if sub else None)
         )
-        alvo = _normalize_kind(kind)
         protocolo = _guess_protocolo(payload, result, extra_obj)
         filename = it.get("filename") or extra_obj.get("filename") or _guess_filename(payload, result, extra_obj)
         raw_action = it.get("action")
@@ -462,29 +521,11 @@ def list_actions(kind: Optional[str] = Query(default=None)) -> Dict[str, Any]:
 
     Observação
     ----------
-    Aceita `kind` com ou sem prefixo `automations/`; a comparação é feita após normalização.
+    Aceita `kind` com ou sem prefixo `automations/`; a comparação é feita após normalização
+    (no próprio SQL, via `SELECT DISTINCT`).
     """
     try:
-        kind_norm = _normalize_kind(kind)
-        try:
-            rows = db.list_audits(limit=2000, offset=0)
-        except TypeError:
-            rows = db.list_audits()
-
-        seen = set()
-        for r in rows:
-            a = (r.get("action") or "").strip()
-            if not a:
-                continue
-            if kind_norm:
-                meta = r.get("meta") or r.get("extra") or {}
-                rk_raw = r.get("kind") or r.get("target_kind") or (meta.get("kind") if isinstance(meta, dict) else None)
-                rk = _normalize_kind(rk_raw)
-                if rk != kind_norm:
-                    continue
-            seen.add(a)
-        items = sorted(seen)
-        return {"items": items}
+        return {"items": db.list_distinct_audit_actions(kind=_normalize_kind(kind))}
     except Exception as e:
         logger.exception("erro ao listar actions")
         raise HTTPException(status_code=500, detail=f"erro ao listar actions: {e}")
@@ -496,25 +537,59 @@ def list_kinds() -> Dict[str, Any]:
     Lista os kinds/alvos distintos (normalizados) presentes nos registros de auditoria.
     """
     try:
-        try:
-            rows = db.list_audits(limit=3000, offset=0)
-        except TypeError:
-            rows = db.list_audits()
-        seen = set()
-        for r in rows:
-            meta = r.get("meta") or r.get("extra") or {}
-            rk_raw = r.get("kind") or r.get("target_kind") or (meta.get("kind") if isinstance(meta, dict) else None)
-            rk = _normalize_kind(rk_raw)
-            if rk:
-                seen.add(rk)
-        return {"items": sorted(seen)}
+        return {"items": db.list_distinct_audit_kinds()}
     except Exception as e:
         logger.exception("erro ao listar kinds")
         raise HTTPException(status_code=500, detail=f"erro ao listar kinds: {e}")
 
 
-@router.get("/audits", response_model=Page[AuditOut])
-def list_audits_api(
+def _audit_filters(
+    kind: Optional[str],
+    username: Optional[str],
+    action: Optional[str],
+    since: Optional[datetime],
+    until: Optional[datetime],
+) -> Dict[str, Any]:
+    """
+    Normaliza os filtros de auditoria recebidos na query para os parâmetros da camada de DB.
+    """
+    return {
+        "kind": _normalize_kind(kind),
+        "username": username,
+        "action": action,
+        "since": _as_utc(since) if since else None,
+        "until": _as_utc(until) if until else None,
+    }
+
+
+async def _list_audits_core(
+    filters: Dict[str, Any],
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[tuple] = None,
+    with_count: bool = True,
+) -> tuple[Optional[int], List[Dict[str, Any]]]:
+    """
+    Núcleo da listagem de audits: busca a página e o total (em paralelo, em duas
+    conexões do pool) e enriquece os itens com dados das submissões.
+
+    Retorna
+    -------
+    (count, items)
+        Total de registros que atendem aos filtros (`None` se `with_count=False`)
+        e a página solicitada.
+    """
+    page = db.list_audits_async(limit=limit, offset=offset, as_api_shape=True, cursor=cursor, **filters)
+    if with_count:
+        items, count = await asyncio.gather(page, db.count_audits_async(**filters))
+    else:
+        items, count = await page, None
+    await _enrich_with_submission(items)
+    return count, items
+
+
+@router.get("/audits", responses={200: {"model": AuditPage}})
+async def list_audits_api(
     kind: Optional[str] = Query(default=None),
     username: Optional[str] = Query(default=None),
     action: Optional[str] = Query(default=None),
@@ -522,77 +597,42 @@ def list_audits_api(
     until: Optional[datetime] = Query(default=None),
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None),
 ):
     """
     Lista eventos de auditoria com filtros e paginação.
 
+    O corpo segue o contrato `AuditPage`, mas é devolvido como `dict`: as linhas
+    já chegam do SQL nos campos de `AuditOut` e são enriquecidas no lugar (sem
+    cópia nem revalidação Pydantic por item).
+
     Filtros
     -------
     - `kind` (normalizado), `username` (substring ou CPF apenas dígitos), `action` (substring),
-      intervalo temporal (`since`, `until`).
+      intervalo temporal (`since`, `until`) — todos aplicados no SQL.
+
+    Paginação
+    ---------
+    - `cursor`: valor de `next_cursor` da página anterior (*keyset* por `ts,id`).
+      Nessas páginas o `COUNT(*)` não é refeito e `count` vem `null`.
+    - `offset`: mantido por compatibilidade; ignorado quando `cursor` é informado.
     """
     try:
-        try:
-            raw = db.list_audits(kind=kind, limit=limit + offset) if kind is not None else db.list_audits(limit=limit + offset)
-        except TypeError:
-            raw = db.list_audits()
-
-        items: List[Dict[str, Any]] = []
-        for r in raw:
-            items.append({
-                "id": r.get("id"),
-                "ts": r.get("at") or r.get("ts"),
-                "username": r.get("actor_nome") or r.get("actor_cpf") or r.get("actor_email") or r.get("username"),
-                "actor_nome": r.get("actor_nome"),
-                "actor_cpf": r.get("actor_cpf"),
-                "actor_email": r.get("actor_email"),
-                "action": r.get("action"),
-                "target_kind": r.get("kind") or r.get("target_kind"),
-                "target_id": r.get("target_id"),
-                "ip": r.get("ip"),
-                "user_agent": r.get("user_agent"),
-                "extra": r.get("meta") or r.get("extra") or {},
-            })
-
-        def match(it: Dict[str, Any]) -> bool:
-            if username:
-                term = (username or "").strip().lower()
-                term_digits = _digits(username)
-
-                hay = " ".join([
-                    str(it.get("username") or ""),
-                    str(it.get("actor_nome") or ""),
-                    str(it.get("actor_email") or ""),
-                ]).lower()
-
-                if term_digits:
-                    cpf_digits = _digits(it.get("actor_cpf"))
-                    if term_digits not in cpf_digits and term not in hay:
-                        return False
-                else:
-                    if term not in hay:
-                        return False
-
-            if action:
-                a = it.get("action") or ""
-                if action.lower() not in str(a).lower():
-                    return False
-            if kind:
-                kind_norm = _normalize_kind(kind)
-                tk_norm = _normalize_kind(it.get("target_kind"))
-                ek = (it.get("extra") or {})
-                ek_norm = _normalize_kind(ek.get("kind") if isinstance(ek, dict) else None)
-                if tk_norm != kind_norm and ek_norm != kind_norm:
-                    return False
-            return True
-
-        filtered = [it for it in items if match(it)]
-        filtered = _filter_dates(filtered, since, until)
-
-        sliced = filtered[offset: offset + limit]
-        _enrich_with_submission(sliced)
-
-        return {"count": len(filtered), "items": sliced}
+        filters = _audit_filters(kind, username, action, since, until)
+        count, items = await _list_audits_core(
+            filters,
+            limit=limit,
+            offset=offset,
+            cursor=_decode_cursor(cursor),
+            with_count=cursor is None,
+        )
+
+        next_cursor = _encode_cursor(items[-1]) if len(items) == limit else None
+        return ORJSONResponse({
+            "count": count,
+            "items": items,
+            "next_cursor": next_cursor,
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -600,8 +640,59 @@ def list_audits_api(
         raise HTTPException(status_code=500, detail=f"erro ao listar audits: {e}")
 
 
+_AUDITS_CSV_HEADER = ["id", "ts", "username", "action", "target_kind", "target_id", "ip", "user_agent", "extra"]
+_CSV_BATCH_ROWS = 500
+
+
+def _audit_csv_row(r: Dict[str, Any]) -> tuple:
+    """
+    Converte um audit (formato das APIs) na tupla de colunas de `_AUDITS_CSV_HEADER`.
+    """
+    return (
+        r.get("id", ""),
+        r.get("ts", ""),
+        r.get("username", ""),
+        r.get("action", ""),
+        r.get("target_kind", ""),
+        r.get("target_id", ""),
+        r.get("ip", ""),
+        r.get("user_agent", ""),
+        orjson.dumps(r.get("extra") or {}, option=orjson.OPT_NON_STR_KEYS).decode("utf-8"),
+    )
+
+
+async def _csv_stream(rows: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """
+    Serializa os audits em CSV sob demanda, em lotes de `_CSV_BATCH_ROWS` linhas.
+
+    Cada lote é escrito com um único `writer.writerows(...)` em um `StringIO`
+    reaproveitado (truncado a cada lote), então a memória de pico independe da
+    quantidade de linhas exportadas. O cabeçalho é enviado antes da primeira
+    linha, sem esperar o cursor produzir um lote.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(_AUDITS_CSV_HEADER)
+    yield buf.getvalue().encode("utf-8")
+    buf.seek(0)
+    buf.truncate(0)
+    batch: List[Dict[str, Any]] = []
+    async for r in rows:
+        batch.append(r)
+        if len(batch) >= _CSV_BATCH_ROWS:
+            writer.writerows(map(_audit_csv_row, batch))
+            batch.clear()
+            yield buf.getvalue().encode("utf-8")
+            buf.seek(0)
+            buf.truncate(0)
+    if batch:
+        writer.writerows(map(_audit_csv_row, batch))
+    if buf.tell():
+        yield buf.getvalue().encode("utf-8")
+
+
 @router.get("/audits.csv")
-def list_audits_csv(
+async def list_audits_csv(
     kind: Optional[str] = Query(default=None),
     username: Optional[str] = Query(default=None),
     action: Optional[str] = Query(default=None),
@@ -612,44 +703,24 @@ def list_audits_csv(
 ):
     """
     Exporta eventos de auditoria em CSV respeitando os mesmos filtros do endpoint JSON.
+
+    A resposta é transmitida (*streaming*) a partir de um cursor do lado do servidor
+    (`db.iter_audits_async`); as colunas do CSV não dependem do enriquecimento
+    com submissões, que portanto não é feito aqui.
     """
-    page = list_audits_api(
-        kind=kind,
-        username=username,
-        action=action,
-        since=since,
-        until=until,
+    rows = db.iter_audits_async(
         limit=limit,
         offset=offset,
+        **_audit_filters(kind, username, action, since, until),
     )
-    buf = io.StringIO()
-    writer = csv.writer(buf)
-    writer.writerow(
-        ["id", "ts", "username", "action", "target_kind", "target_id", "ip", "user_agent", "extra"]
-    )
-    for r in page["items"]:
-        writer.writerow(
-            [
-                r.get("id", ""),
-                r.get("ts", ""),
-                r.get("username", ""),
-                r.get("action", ""),
-                r.get("target_kind", ""),
-                r.get("target_id", ""),
-                r.get("ip", ""),
-                r.get("user_agent", ""),
-                json.dumps(r.get("extra") or {}, ensure_ascii=False),
-            ]
-        )
-    data = buf.getvalue().encode("utf-8")
     headers = {"Content-Disposition": 'attachment; filename="audits.csv"'}
     return StreamingResponse(
-        io.BytesIO(data), media_type="text/csv; charset=utf-8", headers=headers
+        _csv_stream(rows), media_type="text/csv; charset=utf-8", headers=headers
     )
 
 
-@router.get("/submissions", response_model=Page[SubmissionOut])
-def list_submissions_api(
+@router.get("/submissions", responses={200: {"model": SubmissionPage}})
+async def list_submissions_api(
     kind: Optional[str] = Query(default=None),
     username: Optional[str] = Query(default=None),
     status: Optional[str] = Query(default=None),
@@ -657,50 +728,32 @@ def list_submissions_api(
     until: Optional[datetime] = Query(default=None),
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    full: bool = Query(default=False),
 ):
     """
     Lista submissões com filtros por `kind`, `username`, `status` e intervalo temporal.
+
+    O corpo segue o contrato `SubmissionPage`, devolvido como `dict` (sem
+    revalidação Pydantic por item). Para não trafegar JSONs grandes, por padrão
+    os itens não incluem `payload`/`result`; `?full=1` os devolve como antes
+    (ou use `/submissions/{id}` para o detalhe de um item).
+    Filtros, intervalo (`created_at`), paginação e total são resolvidos no SQL.
     """
     try:
-        try:
-            items = db.list_submissions_admin(
-                kind=kind, username=username, status=status, limit=limit + offset, offset=0
-            )
-        except AttributeError:
-            raise HTTPException(
-                status_code=500,
-                detail="list_submissions_admin() não disponível na camada de banco de dados; implemente no módulo de DB do BFF para habilitar o painel de controle.",
-            )
-
-        norm: List[Dict[str, Any]] = []
-        for r in items:
-            result_obj = _to_obj(r.get("result"))
-            logical_status = r.get("status")
-            if isinstance(result_obj, dict):
-                soft_meta = result_obj.get("_soft_delete") or {}
-                if isinstance(soft_meta, dict) and soft_meta.get("deleted"):
-                    logical_status = "deleted"
-                else:
-                    result_status = (result_obj.get("status") or "").strip()
-                    if result_status:
-                        logical_status = result_status
-
-            norm.append({
-                "id": r.get("id"),
-                "kind": r.get("kind"),
-                "status": logical_status,
-                "username": r.get("actor_nome") or r.get("actor_cpf") or r.get("actor_email") or r.get("username"),
-                "user_id": r.get("actor_cpf") or r.get("user_id"),
-                "created_at": r.get("created_at"),
-                "updated_at": r.get("updated_at"),
-                "payload": r.get("payload") or {},
-                "result": result_obj,
-                "error": r.get("error"),
-            })
-
-        norm = _filter_dates(norm, since, until, key_candidates=("created_at", "updated_at", "ts"))
-        sliced = norm[offset: offset + limit]
-        return {"count": len(norm), "items": sliced}
+        filters = {
+            "kind": kind,
+            "username": username,
+            "status": status,
+            "since": _as_utc(since) if since else None,
+            "until": _as_utc(until) if until else None,
+        }
+        items, count = await asyncio.gather(
+            db.list_submissions_admin_lite_async(
+                limit=limit, offset=offset, as_api_shape=True, with_payload=full, **filters
+            ),
+            db.count_submissions_admin_lite_async(**filters),
+        )
+        return ORJSONResponse({"count": count, "items": items})
     except HTTPException:
         raise
     except Exception as e:
@@ -708,13 +761,17 @@ def list_submissions_api(
         raise HTTPException(status_code=500, detail=f"erro ao listar submissions: {e}")
 
 
-@router.get("/submissions/{sid}", response_model=SubmissionOut)
-def get_submission_api(sid: str):
+@router.get("/submissions/{sid}", responses={200: {"model": SubmissionOut}})
+async def get_submission_api(sid: str):
     """
     Recupera os detalhes de uma submissão específica pelo seu identificador.
+
+    O corpo segue o contrato `SubmissionOut`, mas é devolvido como `dict` montado
+    diretamente da linha do banco (campos confiáveis; sem revalidação Pydantic
+    de `payload`/`result`, que podem ser grandes).
     """
     try:
-        sub = db.get_submission(sid)
+        sub = await db.get_submission_async(sid)
         if not sub:
             raise HTTPException(status_code=404, detail=f"submission {sid} não encontrada")
 
@@ -729,7 +786,7 @@ def get_submission_api(sid: str):
                 if result_status:
                     logical_status = result_status
 
-        return {
+        return ORJSONResponse({
             "id": sub.get("id"),
             "kind": sub.get("kind"),
             "status": logical_status,
@@ -740,7 +797,7 @@ def get_submission_api(sid: str):
             "payload": sub.get("payload") or {},
             "result": result_obj,
             "error": sub.get("error"),
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
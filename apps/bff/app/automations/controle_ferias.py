@@ -28,14 +28,16 @@ Detalhes de implementação
 
 import csv
 import io
-import json
 import logging
+import os
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse, StreamingResponse, PlainTextResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -51,9 +53,16 @@ router = APIRouter(
     prefix="/api/automations/controle/ferias",
     tags=["automations", "controle", "ferias"],
     dependencies=[Depends(require_roles_any(*_CONTROL_FERIAS_ALLOWED_ROLES))],
+    default_response_class=ORJSONResponse,
 )
 
 templates = Jinja2Templates(directory=str(Path(__file__).parent / "templates"))
+# Mesmo esquema do painel de auditoria (`controle.py`): fora de `dev` o template é
+# resolvido uma vez e sem `stat` de recarga; em `dev` é buscado por requisição.
+_TEMPLATES_DEV = os.getenv("ENV", "dev") == "dev"
+templates.env.auto_reload = _TEMPLATES_DEV
+_UI_TEMPLATE_NAME = "controle_ferias/ui.html"
+_UI_TEMPLATE = None if _TEMPLATES_DEV else templates.env.get_template(_UI_TEMPLATE_NAME)
 
 
 class Filtro(BaseModel):
@@ -81,7 +90,7 @@ class Filtro(BaseModel):
     servidor: Optional[str] = None
     setor: Optional[str] = None
     status: Optional[str] = None
-    limit: int = Field(default=2000, ge=1, le=10000)
+    limit: int = Field(default=2000, ge=1, le=50000)
 
 
 class EventoFerias(BaseModel):
@@ -135,22 +144,21 @@ def _to_obj(x: Any) -> Dict[str, Any]:
     Converte diferentes tipos (dict, JSON em str/bytes) para `dict`.
 
     Retorna um dict vazio quando a conversão não é possível.
+
+    Observação
+    ----------
+    Colunas JSONB já chegam como `dict` (decodificadas com orjson em `app.db`);
+    o parse (orjson, direto sobre bytes/str) só atende valores legados em texto.
     """
     if isinstance(x, dict):
         return x
-    if x is None:
+    if not x:
+        return {}
+    try:
+        obj = orjson.loads(x)
+    except Exception:
         return {}
-    if isinstance(x, (bytes, bytearray)):
-        try:
-            return json.loads(x.decode("utf-8"))
-        except Exception:
-            return {}
-    if isinstance(x, str):
-        try:
-            return json.loads(x)
-        except Exception:
-            return {}
-    return {}
+    return obj if isinstance(obj, dict) else {}
 
 
 def _is_soft_deleted(sub: Dict[str, Any]) -> bool:
@@ -184,7 +192,20 @@ def _norm_date(v: Any) -> Optional[date]:
     s = str(v).strip()
     if not s:
         return None
+    return _parse_iso_str(s)
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso_str(s: str) -> Optional[date]:
+    """
+    Núcleo memoizado de `_norm_date` para strings ISO já aparadas.
+
+    As mesmas datas se repetem muito entre submissões/eventos; o formato
+    `YYYY-MM-DD` (o mais comum) é montado direto, sem passar por `fromisoformat`.
+    """
     try:
+        if len(s) == 10 and s[4] == "-" and s[7] == "-":
+            return date(int(s[:4]), int(s[5:7]), int(s[8:10]))
         if "T" in s or " " in s:
             return datetime.fromisoformat(s.replace("Z", "+00:00")).date()
         return datetime.fromisoformat(s).date()
@@ -197,21 +218,47 @@ def _text(x: Any) -> str:
     return str(x or "").strip()
 
 
-def _match_contains(hay: str, needle: str) -> bool:
-    """Compara inclusão de substring de forma case-insensitive."""
-    return needle.lower() in hay.lower()
+_STR_INTERN_MAX = 50000
+_STR_INTERN: Dict[str, str] = {}
+
+
+def _intern(s: str) -> str:
+    """
+    Devolve uma instância única para textos repetidos entre eventos (setor, status,
+    servidor), reduzindo cópias na lista mantida em `_EVENTOS_CACHE`.
+    """
+    if len(_STR_INTERN) >= _STR_INTERN_MAX:
+        _STR_INTERN.clear()
+    return _STR_INTERN.setdefault(s, s)
+
+
+_INICIO_KEYS = ("inicio", "data_inicio")
+_FIM_KEYS = ("fim", "data_fim")
+_OBS_KEYS = ("obs", "observacao")
+_SERVIDOR_KEYS = ("servidor", "nome")
+_MATRICULA_KEYS = ("matricula", "siape")
+_SETOR_KEYS = ("setor", "diretoria", "unidade")
+_COLOR_KEYS = ("email", "cpf")
 
 
-def _explode_periodos(sub: Dict[str, Any]) -> List[Dict[str, Any]]:
+def _first(d: Dict[str, Any], keys: tuple) -> Any:
+    """Retorna o primeiro valor verdadeiro de `d` entre `keys` (ou `None`)."""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return None
+
+
+def _explode_periodos(payload: Dict[str, Any], result: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
-    Extrai 1..N períodos de uma submissão.
+    Extrai 1..N períodos de uma submissão, a partir de `payload`/`result` já
+    convertidos para `dict` pelo chamador.
 
     Prioriza `periodos[]` no payload/resultado; caso ausente, tenta chaves simples
     `inicio`/`fim` (ou `data_inicio`/`data_fim`). Cada item produzido contém:
     - `inicio`, `fim`, `obs`, `idx`.
     """
-    payload = _to_obj(sub.get("payload"))
-    result = _to_obj(sub.get("result"))
     candidates: List[Dict[str, Any]] = []
 
     per = payload.get("periodos") or result.get("periodos")
@@ -221,9 +268,9 @@ def _explode_periodos(sub: Dict[str, Any]) -> List[Dict[str, Any]]:
                 continue
             candidates.append(
                 {
-                    "inicio": p.get("inicio") or p.get("data_inicio"),
-                    "fim": p.get("fim") or p.get("data_fim"),
-                    "obs": p.get("obs") or p.get("observacao"),
+                    "inicio": _first(p, _INICIO_KEYS),
+                    "fim": _first(p, _FIM_KEYS),
+                    "obs": _first(p, _OBS_KEYS),
                     "idx": i,
                 }
             )
@@ -231,10 +278,8 @@ def _explode_periodos(sub: Dict[str, Any]) -> List[Dict[str, Any]]:
     if not candidates:
         candidates.append(
             {
-                "inicio": payload.get("inicio")
-                or payload.get("data_inicio")
-                or result.get("inicio"),
-                "fim": payload.get("fim") or payload.get("data_fim") or result.get("fim"),
+                "inicio": _first(payload, _INICIO_KEYS) or result.get("inicio"),
+                "fim": _first(payload, _FIM_KEYS) or result.get("fim"),
                 "obs": payload.get("obs") or result.get("obs"),
                 "idx": 0,
             }
@@ -243,28 +288,34 @@ def _explode_periodos(sub: Dict[str, Any]) -> List[Dict[str, Any]]:
     return candidates
 
 
-def _build_eventos(sub: Dict[str, Any]) -> List[EventoFerias]:
+def _build_eventos(sub: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
-    Converte uma submissão (kind='ferias') em 1..N `EventoFerias`.
+    Converte uma submissão (kind='ferias') em 1..N eventos no formato `EventoFerias`.
 
     Regras
     ------
     - Corrige inversão de datas quando `fim < inicio`.
     - Datas `end` permanecem inclusivas (o iCal fará +1 dia).
+    - Os valores são produzidos aqui mesmo (`_text`/`isoformat`), por isso os eventos
+      são `dict` simples com os campos de `EventoFerias` (sem modelo Pydantic).
     """
-    payload = _to_obj(sub.get("payload"))
-    result = _to_obj(sub.get("result"))
-
-    servidor = _text(
-        payload.get("servidor") or payload.get("nome") or sub.get("actor_nome") or sub.get("username")
-    )
-    matricula = _text(payload.get("matricula") or payload.get("siape"))
-    setor = _text(payload.get("setor") or payload.get("diretoria") or payload.get("unidade"))
-    status = _text(sub.get("status") or result.get("status") or payload.get("status"))
-    color_key = _text(payload.get("email") or payload.get("cpf") or servidor or matricula)
-
-    eventos: List[EventoFerias] = []
-    for per in _explode_periodos(sub):
+    payload = sub.get("payload")
+    if type(payload) is not dict:
+        payload = _to_obj(payload)
+    result = sub.get("result")
+    if type(result) is not dict:
+        result = _to_obj(result)
+
+    servidor = _intern(_text(
+        _first(payload, _SERVIDOR_KEYS) or sub.get("actor_nome") or sub.get("username")
+    ))
+    matricula = _text(_first(payload, _MATRICULA_KEYS))
+    setor = _intern(_text(_first(payload, _SETOR_KEYS)))
+    status = _intern(_text(sub.get("status") or result.get("status") or payload.get("status")))
+    color_key = _intern(_text(_first(payload, _COLOR_KEYS) or servidor or matricula))
+
+    eventos: List[Dict[str, Any]] = []
+    for per in _explode_periodos(payload, result):
         di = _norm_date(per.get("inicio"))
         df = _norm_date(per.get("fim"))
         if not di or not df:
@@ -272,54 +323,216 @@ def _build_eventos(sub: Dict[str, Any]) -> List[EventoFerias]:
         if df < di:
             di, df = df, di
         eventos.append(
-            EventoFerias(
-                id=f"{sub.get('id')}#{per.get('idx', 0)}",
-                servidor=servidor,
-                matricula=matricula or None,
-                setor=setor or None,
-                status=status or None,
-                start=di.isoformat(),
-                end=df.isoformat(),
-                obs=_text(per.get("obs")) or None,
-                colorKey=color_key or None,
-            )
+            {
+                "id": f"{sub.get('id')}#{per.get('idx', 0)}",
+                "servidor": servidor,
+                "matricula": matricula or None,
+                "setor": setor or None,
+                "status": status or None,
+                "start": di.isoformat(),
+                "end": df.isoformat(),
+                "obs": _text(per.get("obs")) or None,
+                "colorKey": color_key or None,
+            }
         )
     return eventos
 
 
-def _apply_filters(items: List[EventoFerias], f: Filtro) -> List[EventoFerias]:
+def _apply_filters(items: Iterable[Dict[str, Any]], f: Filtro) -> Iterator[Dict[str, Any]]:
     """
-    Aplica filtros de janela temporal e texto aos eventos.
+    Aplica filtros de janela temporal e texto aos eventos (sob demanda).
 
     Critérios
     ---------
     - Intervalo: inclui eventos que interceptam [since, until].
     - Texto: `servidor`/`setor` por substring; `status` por igualdade (case-insensitive).
     - Limite: interrompe ao atingir `f.limit`.
+
+    Os termos são normalizados (`casefold`) uma única vez por requisição, fora do laço.
+    Como `start`/`end` saem de `_build_eventos` sempre em `YYYY-MM-DD`, a janela é
+    comparada como texto ISO (mesma ordem das datas), sem reinterpretar cada evento.
     """
-    def in_range(ev: EventoFerias) -> bool:
-        di = _norm_date(ev.start)
-        df = _norm_date(ev.end)
-        if f.since and df and df < f.since.date():
-            return False
-        if f.until and di and di > f.until.date():
-            return False
-        return True
+    since_iso = f.since.date().isoformat() if f.since else None
+    until_iso = f.until.date().isoformat() if f.until else None
+
+    needle_srv = f.servidor.casefold() if f.servidor else None
+    needle_set = f.setor.casefold() if f.setor else None
+    needle_st = f.status.casefold() if f.status else None
 
-    out: List[EventoFerias] = []
+    n = 0
     for it in items:
-        if f.servidor and not _match_contains(it.servidor, f.servidor):
+        if needle_srv and needle_srv not in it["servidor"].casefold():
             continue
-        if f.setor and not _match_contains(it.setor or "", f.setor):
+        if needle_set and needle_set not in (it["setor"] or "").casefold():
             continue
-        if f.status and (it.status or "").lower() != f.status.lower():
+        if needle_st and (it["status"] or "").casefold() != needle_st:
             continue
-        if not in_range(it):
+        if since_iso and it["end"] < since_iso:
             continue
-        out.append(it)
-        if len(out) >= f.limit:
+        if until_iso and it["start"] > until_iso:
+            continue
+        yield it
+        n += 1
+        if n >= f.limit:
             break
-    return out
+
+
+_FERIAS_LOAD_MAX = 50000
+
+
+def _load_ferias_subs() -> Iterator[Dict[str, Any]]:
+    """
+    Itera as submissões `ferias` não excluídas (cursor do lado do servidor, em
+    lotes), mais recentes primeiro e até `_FERIAS_LOAD_MAX`, para que os eventos
+    sejam montados conforme as linhas chegam.
+
+    A iteração é consumida em `_load_all_eventos`, antes de qualquer *streaming*,
+    para que falhas de banco ainda virem HTTP 500 em vez de uma resposta truncada.
+    """
+    try:
+        yield from db.iter_submissions_admin(
+            kind="ferias",
+            username=None,
+            status=None,
+            limit=_FERIAS_LOAD_MAX,
+            offset=0,
+            exclude_deleted=True,
+        )
+    except AttributeError:
+        raise HTTPException(status_code=500, detail="iter_submissions_admin(kind='ferias') indisponível.")
+    except Exception as e:
+        logger.exception("Erro ao carregar submissões de férias")
+        raise HTTPException(status_code=500, detail=f"erro ao listar eventos: {e}")
+
+
+_EVENTOS_CACHE: Optional[tuple[Any, List[Dict[str, Any]]]] = None
+
+
+def _load_all_eventos() -> List[Dict[str, Any]]:
+    """
+    Retorna a lista completa (sem filtros) de eventos normalizados, mantida em
+    cache no processo por versão da tabela.
+
+    A versão é `db.submissions_version("ferias")`: qualquer escrita em submissões
+    de férias (inclusive o cancelamento abaixo) gera uma nova lista. Há uma
+    única entrada, compartilhada por todas as consultas, cujos filtros são
+    aplicados depois por `_apply_filters`. Os dicts em cache não devem ser
+    alterados.
+    """
+    global _EVENTOS_CACHE
+    try:
+        version = db.submissions_version("ferias")
+    except Exception as e:
+        logger.exception("Erro ao consultar versão das submissões de férias")
+        raise HTTPException(status_code=500, detail=f"erro ao listar eventos: {e}")
+
+    cached = _EVENTOS_CACHE
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    eventos: List[Dict[str, Any]] = []
+    for sub in _load_ferias_subs():
+        # Não considera registros soft-deleted no painel de controle do RH
+        if _is_soft_deleted(sub):
+            continue
+        eventos.extend(_build_eventos(sub))
+
+    _EVENTOS_CACHE = (version, eventos)
+    return eventos
+
+
+def _iter_eventos(f: Filtro) -> Iterator[Dict[str, Any]]:
+    """
+    Itera os eventos (dicts no formato `EventoFerias`) já filtrados.
+
+    Submissões marcadas como soft delete (via automação `ferias`) não geram eventos.
+    A carga (e eventuais erros de banco) acontece já na chamada, antes de qualquer
+    *streaming*.
+    """
+    return _apply_filters(_load_all_eventos(), f)
+
+
+_CSV_HEADER = ["id", "servidor", "matricula", "setor", "status", "inicio", "fim", "obs"]
+_CSV_FLUSH_ROWS = 256
+
+
+def _csv_stream(items: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """
+    Gera o CSV de eventos em blocos (a cada `_CSV_FLUSH_ROWS` linhas), reaproveitando
+    um único `StringIO` em vez de montar o arquivo inteiro em memória.
+    """
+    buf = io.StringIO()
+    w = csv.writer(buf)
+    w.writerow(_CSV_HEADER)
+    for n, it in enumerate(items, start=1):
+        w.writerow(
+            [
+                it["id"],
+                it["servidor"],
+                it.get("matricula", ""),
+                it.get("setor", ""),
+                it.get("status", ""),
+                it["start"],
+                it["end"],
+                (it.get("obs") or ""),
+            ]
+        )
+        if n % _CSV_FLUSH_ROWS == 0:
+            yield buf.getvalue().encode("utf-8")
+            buf.seek(0)
+            buf.truncate(0)
+    if buf.tell():
+        yield buf.getvalue().encode("utf-8")
+
+
+# Escape de TEXT do RFC 5545 (§3.3.11) numa única passada por valor.
+_ICS_ESCAPE = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n", "\r": ""})
+
+_VEVENT_TMPL = (
+    "BEGIN:VEVENT\r\n"
+    "UID:{uid}@portal-agepar\r\n"
+    "SUMMARY:Férias — {summary}\r\n"
+    "DTSTART;VALUE=DATE:{dt_start}\r\n"
+    "DTEND;VALUE=DATE:{dt_end}\r\n"
+    "DESCRIPTION:{desc}\r\n"
+    "END:VEVENT\r\n"
+)
+
+
+def _ics_stream(items: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """
+    Gera o iCalendar incrementalmente: cabeçalho, um bloco VEVENT por evento e rodapé.
+
+    Cada VEVENT sai de uma única formatação de `_VEVENT_TMPL`; as datas `YYYYMMDD`
+    vêm do ISO (`YYYY-MM-DD`) sem `strftime`. Textos livres (servidor, setor,
+    status, obs) são escapados com `_ICS_ESCAPE`.
+    """
+    yield (
+        "BEGIN:VCALENDAR\r\n"
+        "VERSION:2.0\r\n"
+        "PRODID:-//Portal AGEPAR//Controle Férias//PT-BR\r\n"
+        "CALSCALE:GREGORIAN\r\n"
+        "METHOD:PUBLISH\r\n"
+    ).encode("utf-8")
+    for it in items:
+        dt_start = _norm_date(it["start"]) or date.today()
+        dt_end_inc = _norm_date(it["end"]) or dt_start
+        dt_end_ex = dt_end_inc + timedelta(days=1)
+        desc_parts: List[str] = []
+        if it.get("setor"):
+            desc_parts.append(f"Setor: {it['setor'].translate(_ICS_ESCAPE)}")
+        if it.get("status"):
+            desc_parts.append(f"Status: {it['status'].translate(_ICS_ESCAPE)}")
+        if it.get("obs"):
+            desc_parts.append(f"Obs: {it['obs'].translate(_ICS_ESCAPE)}")
+        yield _VEVENT_TMPL.format(
+            uid=it["id"],
+            summary=it["servidor"].translate(_ICS_ESCAPE),
+            dt_start=dt_start.isoformat().replace("-", ""),
+            dt_end=dt_end_ex.isoformat().replace("-", ""),
+            desc="\\n".join(desc_parts),
+        ).encode("utf-8")
+    yield b"END:VCALENDAR"
 
 
 @router.get("/ui", response_class=HTMLResponse)
@@ -327,7 +540,8 @@ def get_ui(request: Request):
     """
     Retorna a página HTML (Jinja2) da visualização de férias.
     """
-    return templates.TemplateResponse("controle_ferias/ui.html", {"request": request})
+    tpl = _UI_TEMPLATE or templates.env.get_template(_UI_TEMPLATE_NAME)
+    return HTMLResponse(tpl.render(request=request))
 
 
 @router.post("/submissions/{sid}/cancel")
@@ -437,31 +651,14 @@ def list_events(
 
     Retorna
     -------
-    dict
-        `{"count": int, "items": List[EventoFerias as dict]}`
+    ORJSONResponse
+        `{"count": int, "items": List[EventoFerias as dict]}`, serializado direto
+        com orjson (os itens já são `dict` prontos, sem `jsonable_encoder`).
     """
     try:
-        try:
-            subs = db.list_submissions_admin(
-                kind="ferias",
-                username=None,
-                status=None,
-                limit=limit,
-                offset=0,
-            )
-        except AttributeError:
-            raise HTTPException(status_code=500, detail="list_submissions_admin(kind='ferias') indisponível.")
-
-        eventos: List[EventoFerias] = []
-        for sub in subs:
-            # Não considera registros soft-deleted no painel de controle do RH
-            if _is_soft_deleted(sub):
-                continue
-            eventos.extend(_build_eventos(sub))
-
         f = Filtro(since=since, until=until, servidor=servidor, setor=setor, status=status, limit=limit)
-        items = _apply_filters(eventos, f)
-        return {"count": len(items), "items": [e.model_dump() for e in items]}
+        items = list(_iter_eventos(f))
+        return ORJSONResponse({"count": len(items), "items": items})
     except HTTPException:
         raise
     except Exception as e:
@@ -485,26 +682,12 @@ def events_csv(
     ---------
     id, servidor, matricula, setor, status, inicio, fim, obs
     """
-    data = list_events(since=since, until=until, servidor=servidor, setor=setor, status=status, limit=limit)
-    buf = io.StringIO()
-    w = csv.writer(buf)
-    w.writerow(["id", "servidor", "matricula", "setor", "status", "inicio", "fim", "obs"])
-    for it in data["items"]:
-        w.writerow(
-            [
-                it["id"],
-                it["servidor"],
-                it.get("matricula", ""),
-                it.get("setor", ""),
-                it.get("status", ""),
-                it["start"],
-                it["end"],
-                (it.get("obs") or ""),
-            ]
-        )
-    out = buf.getvalue().encode("utf-8")
+    f = Filtro(since=since, until=until, servidor=servidor, setor=setor, status=status, limit=limit)
+    items = _iter_eventos(f)
     headers = {"Content-Disposition": 'attachment; filename="ferias.csv"'}
-    return StreamingResponse(io.BytesIO(out), media_type="text/csv; charset=utf-8", headers=headers)
+    return StreamingResponse(
+        _csv_stream(items), media_type="text/csv; charset=utf-8", headers=headers
+    )
 
 
 @router.get("/events.ics")
@@ -524,38 +707,9 @@ def events_ics(
     - DTSTART e DTEND são `VALUE=DATE`.
     - `end` é inclusivo nos dados; para o iCal é convertido para end-exclusive (+1 dia).
     """
-    data = list_events(since=since, until=until, servidor=servidor, setor=setor, status=status, limit=limit)
-    lines = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        "PRODID:-//Portal AGEPAR//Controle Férias//PT-BR",
-        "CALSCALE:GREGORIAN",
-        "METHOD:PUBLISH",
-    ]
-    for it in data["items"]:
-        dt_start = _norm_date(it["start"]) or date.today()
-        dt_end_inc = _norm_date(it["end"]) or dt_start
-        dt_end_ex = dt_end_inc + timedelta(days=1)
-        uid = f"{it['id']}@portal-agepar"
-        summary = f"Férias — {it['servidor']}"
-        desc_parts: List[str] = []
-        if it.get("setor"):
-            desc_parts.append(f"Setor: {it['setor']}")
-        if it.get("status"):
-            desc_parts.append(f"Status: {it['status']}")
-        if it.get("obs"):
-            desc_parts.append(f"Obs: {it['obs']}")
-        desc_text = "\\n".join(desc_parts)
-        lines += [
-            "BEGIN:VEVENT",
-            f"UID:{uid}",
-            f"SUMMARY:{summary}",
-            f"DTSTART;VALUE=DATE:{dt_start.strftime('%Y%m%d')}",
-            f"DTEND;VALUE=DATE:{dt_end_ex.strftime('%Y%m%d')}",
-            f"DESCRIPTION:{desc_text}",
-            "END:VEVENT",
-        ]
-    lines.append("END:VCALENDAR")
-    body = "\r\n".join(lines)
+    f = Filtro(since=since, until=until, servidor=servidor, setor=setor, status=status, limit=limit)
+    items = _iter_eventos(f)
     headers = {"Content-Disposition": 'attachment; filename=\"ferias.ics\"'}
-    return PlainTextResponse(content=body, media_type="text/calendar; charset=utf-8", headers=headers)
+    return StreamingResponse(
+        _ics_stream(items), media_type="text/calendar; charset=utf-8", headers=headers
+    )
@@ -20,18 +20,26 @@ Integrações
 """
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Depends
-from starlette.responses import StreamingResponse, HTMLResponse
+from fastapi.responses import ORJSONResponse
+from starlette.responses import FileResponse, HTMLResponse, Response
 from pydantic import BaseModel, Field, ConfigDict, ValidationError, field_validator, model_validator
 from typing import Optional, Dict, Any, List
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from functools import lru_cache
 from uuid import uuid4
-from io import BytesIO
-import json
 import logging
 import os
 import pathlib
+import hashlib
 import mimetypes
+import multiprocessing
 import re
+import stat
+
+import orjson
 
 from app.db import (
     insert_submission,
@@ -64,9 +72,12 @@ REQUIRED_ROLES = ("compras",)
 ELEVATED_ROLES = ("admin",)
 MODELS_DIR = os.environ.get("DFD_MODELS_DIR", "/app/templates/dfd_models")
 TPL_DIR = pathlib.Path(__file__).resolve().parent / "templates" / "dfd"
+OUT_DIR = pathlib.Path(os.environ.get("DFD_OUTPUT_DIR", "/app/data/files/dfd"))
 ENV_REAJUSTE_PCA_ACTIVE = "DFD_REAJUSTE_PCA_ACTIVE"
 ENV_DFD_ACCEPTING = "DFD_ACCEPTING"
 ENV_DFD_CLOSED_MESSAGE = "DFD_CLOSED_MESSAGE"
+DFD_RENDER_WORKERS = max(1, int(os.environ.get("DFD_RENDER_WORKERS", "2")))
+DFD_RENDER_TIMEOUT_S = float(os.environ.get("DFD_RENDER_TIMEOUT_S", "180"))
 
 
 def _env_flag(name: str, default: bool = False) -> bool:
@@ -119,13 +130,14 @@ def err_json(status: int, **payload):
 
     Retorna
     -------
-    StreamingResponse
-        Resposta com `application/json; charset=utf-8`.
+    Response
+        Resposta JSON (UTF-8, sem escapar acentos), serializada direto com orjson;
+        valores não nativos (ex.: datetime/UUID em `details`) viram `str`.
     """
-    return StreamingResponse(
-        BytesIO(json.dumps(payload, ensure_ascii=False).encode("utf-8")),
+    return Response(
+        orjson.dumps(payload, default=str),
         status_code=status,
-        media_type="application/json; charset=utf-8",
+        media_type="application/json",
     )
 
 
@@ -142,14 +154,9 @@ def _to_obj(x, default=None):
         return {} if default is None else default
     if isinstance(x, (dict, list)):
         return x
-    if isinstance(x, (bytes, bytearray)):
-        try:
-            return json.loads(x.decode("utf-8"))
-        except Exception:
-            return {} if default is None else default
-    if isinstance(x, str):
+    if isinstance(x, (bytes, bytearray, str)):
         try:
-            return json.loads(x)
+            return orjson.loads(x)
         except Exception:
             return {} if default is None else default
     return {} if default is None else default
@@ -166,11 +173,17 @@ def none_if_empty(v: Optional[str]) -> Optional[str]:
     return v
 
 
+_SAFE_COMP_RE = re.compile(r"[^A-Za-z0-9._-]+")
+_NUM_CHARS_RE = re.compile(r"[^0-9,.\s]")
+_NUM_SEPS_RE = re.compile(r"[.,]")
+_NON_DIGITS_RE = re.compile(r"\D")
+
+
 def _safe_comp(txt: str) -> str:
     """
     Normaliza componentes de filename removendo caracteres perigosos.
     """
-    return re.sub(r"[^A-Za-z0-9._-]+", "_", str(txt)).strip("_")
+    return _SAFE_COMP_RE.sub("_", str(txt)).strip("_")
 
 
 def parse_decimal_br(value: Any) -> float:
@@ -205,7 +218,7 @@ def parse_decimal_br(value: Any) -> float:
         return 0.0
 
     # Mantém apenas dígitos, separadores e espaços; depois remove espaços (ex.: "1 234,56")
-    s = re.sub(r"[^0-9,.\s]", "", s).replace(" ", "").strip()
+    s = _NUM_CHARS_RE.sub("", s).replace(" ", "").strip()
     if not s:
         return 0.0
 
@@ -221,8 +234,8 @@ def parse_decimal_br(value: Any) -> float:
     int_part_raw = s[:last_sep_idx]
     frac_part_raw = s[last_sep_idx + 1 :]
 
-    int_part = re.sub(r"[.,]", "", int_part_raw)
-    frac_part = re.sub(r"[.,]", "", frac_part_raw)
+    int_part = _NUM_SEPS_RE.sub("", int_part_raw)
+    frac_part = _NUM_SEPS_RE.sub("", frac_part_raw)
 
     if not int_part:
         int_part = "0"
@@ -260,21 +273,24 @@ def parse_int_br(value: Any) -> int:
     if not s:
         return 0
 
-    s = re.sub(r"[^0-9,.\s]", "", s).replace(" ", "").strip()
+    s = _NUM_CHARS_RE.sub("", s).replace(" ", "").strip()
     if not s:
         return 0
 
     # Se tem ambos, assume último como decimal e usa só a parte inteira
     if "," in s and "." in s:
         last_sep_idx = max(s.rfind(","), s.rfind("."))
-        int_part = re.sub(r"[.,]", "", s[:last_sep_idx])
+        int_part = _NUM_SEPS_RE.sub("", s[:last_sep_idx])
         return int(int_part) if int_part else 0
 
     # Apenas um tipo de separador: trata como milhar e remove tudo que não for dígito
-    digits = re.sub(r"\D", "", s)
+    digits = _NON_DIGITS_RE.sub("", s)
     return int(digits) if digits else 0
 
 
+_MODELS_CACHE: tuple[int, List[Dict[str, Any]]] = (-1, [])
+
+
 def _list_models() -> List[Dict[str, Any]]:
     """
     Lista subpastas de `MODELS_DIR` que contenham `model.docx`.
@@ -283,15 +299,41 @@ def _list_models() -> List[Dict[str, Any]]:
     -------
     List[dict]
         Itens `{ "slug": <nome_da_pasta>, "file": "model.docx" }`.
+
+    Observação
+    ----------
+    O resultado fica em cache pelo `st_mtime_ns` de `MODELS_DIR` (muda quando
+    pastas de modelo são criadas, removidas ou renomeadas). Um `model.docx`
+    incluído depois numa pasta já existente só aparece após nova alteração no
+    diretório base (ou reinício do processo).
     """
+    global _MODELS_CACHE
+    try:
+        st = os.stat(MODELS_DIR)
+    except OSError:
+        return []
+    if not stat.S_ISDIR(st.st_mode):
+        return []
+    if st.st_mtime_ns == _MODELS_CACHE[0]:
+        return list(_MODELS_CACHE[1])
+
     items: List[Dict[str, Any]] = []
-    base = pathlib.Path(MODELS_DIR)
-    if not base.exists() or not base.is_dir():
-        return items
-    for child in sorted(base.iterdir()):
-        if child.is_dir() and (child / "model.docx").exists():
-            items.append({"slug": child.name, "file": "model.docx"})
-    return items
+    with os.scandir(MODELS_DIR) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if entry.is_dir() and os.path.exists(os.path.join(entry.path, "model.docx")):
+            items.append({"slug": entry.name, "file": "model.docx"})
+    _MODELS_CACHE = (st.st_mtime_ns, items)
+    return list(items)
+
+
+@lru_cache(maxsize=64)
+def _placeholders_cached(tpl_path: str, mtime_ns: int) -> tuple:
+    """
+    Memoiza `get_docx_placeholders` por (caminho, `st_mtime_ns`) do modelo: o
+    DOCX só é descompactado/analisado de novo quando o arquivo muda.
+    """
+    return tuple(get_docx_placeholders(tpl_path))
 
 
 def _get_model_path(slug: str) -> Optional[str]:
@@ -339,15 +381,14 @@ def _owns_submission(row: Dict[str, Any], user: Dict[str, Any]) -> bool:
     ------
     - Preferência por correspondência de CPF.
     - Caso não haja CPF no registro, usa correspondência por e-mail.
+
+    Só normaliza o identificador que de fato decide (CPF, ou e-mail na falta dele).
     """
-    u_cpf = (user.get("cpf") or "").strip() or None
-    u_email = (user.get("email") or "").strip() or None
-    owner_cpf = (row.get("actor_cpf") or "").strip() or None
-    owner_email = (row.get("actor_email") or "").strip() or None
-    return bool(
-        (owner_cpf and u_cpf and owner_cpf == u_cpf)
-        or (not owner_cpf and owner_email and u_email and owner_email == u_email)
-    )
+    owner_cpf = (row.get("actor_cpf") or "").strip()
+    if owner_cpf:
+        return owner_cpf == (user.get("cpf") or "").strip()
+    owner_email = (row.get("actor_email") or "").strip()
+    return bool(owner_email) and owner_email == (user.get("email") or "").strip()
 
 
 def _can_access_submission(row: Dict[str, Any], user: Dict[str, Any]) -> bool:
@@ -366,13 +407,73 @@ def _can_access_submission(row: Dict[str, Any], user: Dict[str, Any]) -> bool:
     return False
 
 
-def _read_html(name: str) -> str:
+_HTML_CACHE_ENABLED = os.getenv("ENV", "dev") != "dev"
+_HTML_CACHE_CONTROL = "private, max-age=60, must-revalidate"
+_ACCESS_ERROR_MSGS = {
+    401: "Faça login para acessar esta automação.",
+    403: "Você não tem permissão para acessar esta automação.",
+}
+
+
+@lru_cache(maxsize=None)
+def _html_page(name: str) -> tuple[bytes, str]:
     """
-    Lê um arquivo HTML de `TPL_DIR` e retorna seu conteúdo.
+    Lê um arquivo HTML de `TPL_DIR` uma vez por processo.
+
+    Retorna
+    -------
+    tuple[bytes, str]
+        Conteúdo já em UTF-8 e o `ETag` (SHA-1) correspondente.
     """
-    path = TPL_DIR / name
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
+    data = (TPL_DIR / name).read_bytes()
+    return data, f'"{hashlib.sha1(data).hexdigest()}"'
+
+
+def _html_page_response(request: Request, name: str) -> Response:
+    """
+    Serve uma página de `TPL_DIR` a partir dos bytes pré-codificados, com `ETag`
+    e `Cache-Control`; responde 304 quando o navegador já tem a mesma versão.
+
+    Em `ENV=dev` o arquivo é relido a cada requisição.
+    """
+    if not _HTML_CACHE_ENABLED:
+        _html_page.cache_clear()
+    data, etag = _html_page(name)
+    headers = {"ETag": etag, "Cache-Control": _HTML_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=data, media_type="text/html; charset=utf-8", headers=headers)
+
+
+@lru_cache(maxsize=8)
+def _access_error_page(status: int) -> bytes:
+    """
+    HTML simples (pré-codificado) para 401/403 nas páginas de UI.
+    """
+    msg = _ACCESS_ERROR_MSGS.get(status, _ACCESS_ERROR_MSGS[403])
+    return f"""<!doctype html><meta charset="utf-8"/><title>Acesso</title>
+        <div style="font-family:system-ui;padding:24px">
+          <h1 style="margin:0 0 8px">{status}</h1>
+          <p style="color:#334155">{msg}</p>
+        </div>""".encode("utf-8")
+
+
+@lru_cache(maxsize=4)
+def _closed_page(msg: str) -> bytes:
+    """
+    HTML (pré-codificado) exibido quando o DFD não está aceitando envios.
+
+    Indexado pela mensagem, pois ela vem de variável de ambiente.
+    """
+    return f"""<!doctype html><html lang="pt-BR"><meta charset="utf-8"/>
+<title>DFD indisponível</title>
+<div style="font-family:system-ui;padding:24px;max-width:720px;margin:0 auto">
+  <div style="border:1px solid #e2e8f0;border-radius:14px;padding:16px;background:#fff">
+    <h1 style="margin:0 0 8px;font-size:18px">DFD temporariamente indisponível</h1>
+    <p style="margin:0;color:#334155;line-height:1.4">{msg}</p>
+    <p style="margin:12px 0 0;color:#64748b;font-size:12px">Se necessário, contate a Coordenadoria Administrativa.</p>
+  </div>
+</div></html>""".encode("utf-8")
 
 
 MAX_ASSUNTO_LEN = 200
@@ -797,8 +898,8 @@ FIELD_INFO: Dict[str, Dict[str, Any]] = {
     "modelo_slug": {"label": "Timbre"},
     "numero": {"label": "Nº do Memorando", "min_length": 1, "max_length": MAX_NUMERO_LEN},
     "assunto": {"label": "Assunto", "max_length": MAX_ASSUNTO_LEN, "min_length": 1},
-    "pcaAno": {"label": "Ano de execução do PCA", "pattern": r"^\d{4}$"},
-    "pca_ano": {"label": "Ano de execução do PCA", "pattern": r"^\d{4}$"},
+    "pcaAno": {"label": "Ano de execução do PCA"},
+    "pca_ano": {"label": "Ano de execução do PCA"},
     "diretoriaDemandante": {"label": "Diretoria demandante", "min_length": 1},
     "diretoria_demandante": {"label": "Diretoria demandante", "min_length": 1},
     "alinhamentoPE": {"label": "Alinhamento com o Planejamento Estratégico", "max_length": MAX_TEXTO_LONGO, "min_length": 1},
@@ -826,6 +927,14 @@ FIELD_INFO: Dict[str, Dict[str, Any]] = {
     "valorTotal": {"label": "Estimativa de valor total (auto)"},
 }
 
+# Rótulo por chave de erro, já resolvido para nome do campo e alias (camelCase) dos
+# modelos: `_format_validation_errors` faz uma única consulta por erro.
+_FIELD_LABELS: Dict[str, str] = {k: v["label"] for k, v in FIELD_INFO.items() if "label" in v}
+for _model in (DfdIn, Item):
+    for _name, _field in _model.model_fields.items():
+        if _field.alias and _field.alias in _FIELD_LABELS:
+            _FIELD_LABELS.setdefault(_name, _FIELD_LABELS[_field.alias])
+
 CAP_EVENTOS_FIELD_LABELS: Dict[str, str] = {
     "descricao": "Descrição (Eventos/Congressos/Seminários)",
     "valorUnitario": "Valor unitário estimado (Eventos/Congressos/Seminários)",
@@ -906,8 +1015,7 @@ def _format_validation_errors(ve: ValidationError) -> List[str]:
             else:
                 label = CAP_CURSOS_FIELD_LABELS.get(field_key, field_key)
         else:
-            info = FIELD_INFO.get(field_key) or FIELD_INFO.get(field_key.replace("modelo_slug", "modeloSlug"), {})
-            label = info.get("label", field_key)
+            label = _FIELD_LABELS.get(field_key, field_key)
 
         typ = err.get("type", "")
         ctx = err.get("ctx") or {}
@@ -947,7 +1055,20 @@ def _format_validation_errors(ve: ValidationError) -> List[str]:
     return msgs
 
 
-router = APIRouter(prefix=f"/api/automations/{KIND}", tags=[f"automation:{KIND}"])
+router = APIRouter(
+    prefix=f"/api/automations/{KIND}",
+    tags=[f"automation:{KIND}"],
+    default_response_class=ORJSONResponse,
+)
+
+
+@router.on_event("startup")
+def _ensure_output_dir() -> None:
+    """
+    Garante o diretório de saída dos artefatos (`OUT_DIR`) uma vez por processo,
+    em vez de a cada submissão.
+    """
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
 @router.get("/schema")
@@ -955,7 +1076,7 @@ async def get_schema():
     """
     Expõe metadados de schema consumidos pela UI do DFD.
     """
-    return {"kind": KIND, "schema": SCHEMA}
+    return ORJSONResponse({"kind": KIND, "schema": SCHEMA})
 
 
 @router.get("/config")
@@ -965,13 +1086,13 @@ async def get_config(user: Dict[str, Any] = Depends(require_roles_any(*REQUIRED_
 
     Nesta fase, `reajustePcaAtivo` é controlado por env-var (DFD_REAJUSTE_PCA_ACTIVE).
     """
-    return {
+    return ORJSONResponse({
         "kind": KIND,
         "version": DFD_VERSION,
         "reajustePcaAtivo": is_reajuste_pca_ativo(),
         "accepting": is_dfd_accepting(),
         "closedMessage": dfd_closed_message(),
-    }
+    })
 
 
 @router.get("/models")
@@ -980,7 +1101,7 @@ async def get_models(user: Dict[str, Any] = Depends(require_roles_any(*REQUIRED_
     Lista modelos DOCX disponíveis (por timbre), protegido por RBAC de compras.
     """
     try:
-        return {"items": _list_models()}
+        return ORJSONResponse({"items": _list_models()})
     except Exception as e:
         logger.exception("list models failed")
         return err_json(500, code="storage_error", message="Falha ao listar modelos.", details=str(e))
@@ -1012,7 +1133,7 @@ async def list_my_submissions(
             limit=limit,
             offset=offset,
         )
-        return {"items": rows, "limit": limit, "offset": offset}
+        return ORJSONResponse({"items": rows, "limit": limit, "offset": offset})
     except Exception as e:
         logger.exception("list_submissions storage error")
         return err_json(500, code="storage_error", message="Falha ao consultar submissões.", details=str(e))
@@ -1035,16 +1156,119 @@ async def get_my_submission(
         return err_json(404, code="not_found", message="Submissão não encontrada.", details={"sid": sid})
     if not _owns_submission(row, user):
         return err_json(403, code="forbidden", message="Você não tem acesso a esta submissão.")
-    return row
+    return ORJSONResponse(row)
 
 
-def _process_submission(sid: str, body: DfdIn, actor: Dict[str, Any]) -> None:
+_RENDER_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _render_worker_init() -> None:
+    """
+    Inicializa o processo de renderização (spawn): replica o logging do BFF, já
+    que o processo filho não executa `app.main`.
+    """
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
+    )
+
+
+def _render_pool() -> ProcessPoolExecutor:
+    """
+    Retorna (criando sob demanda) o pool de processos que renderiza DOCX/PDF.
+
+    Usa `spawn` para não herdar threads/conexões do processo do BFF; o tamanho
+    vem de `DFD_RENDER_WORKERS` (padrão 2).
+    """
+    global _RENDER_POOL
+    if _RENDER_POOL is None:
+        _RENDER_POOL = ProcessPoolExecutor(
+            max_workers=DFD_RENDER_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_render_worker_init,
+        )
+    return _RENDER_POOL
+
+
+def shutdown_render_pool() -> None:
+    """
+    Encerra o pool de renderização (hook de shutdown do aplicativo).
+    """
+    global _RENDER_POOL
+    if _RENDER_POOL is not None:
+        _RENDER_POOL.shutdown(wait=False, cancel_futures=True)
+        _RENDER_POOL = None
+
+
+def _discard_render_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Descarta um pool quebrado (worker morto por OOM/crash nativo), para que o
+    próximo `_render_pool()` crie um novo.
+
+    Só age se `pool` ainda for o pool corrente: várias submissões podem
+    detectar a mesma quebra ao mesmo tempo.
+    """
+    global _RENDER_POOL
+    if _RENDER_POOL is pool:
+        _RENDER_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _render_in_pool(tpl_path: str, ctx: Dict[str, Any], docx_out: str, pdf_out: str) -> bool:
+    """
+    Executa `_render_artifacts` no pool de processos.
+
+    Se o pool estiver quebrado (`BrokenProcessPool`), recria-o e tenta mais uma
+    vez; uma segunda quebra falha apenas esta submissão.
+    """
+    for attempt in (1, 2):
+        pool = _render_pool()
+        try:
+            return await asyncio.wrap_future(pool.submit(_render_artifacts, tpl_path, ctx, docx_out, pdf_out))
+        except BrokenProcessPool:
+            _discard_render_pool(pool)
+            if attempt == 2:
+                raise
+            logger.warning("[DFD] Pool de renderização quebrado; recriando e tentando novamente.")
+    return False
+
+
+def _render_artifacts(tpl_path: str, ctx: Dict[str, Any], docx_out: str, pdf_out: str) -> bool:
+    """
+    Etapa pesada do processamento, executada no pool de processos: renderiza o
+    DOCX e tenta convertê-lo para PDF.
+
+    Não acessa o banco (as gravações continuam no processo do BFF).
+
+    Retorna
+    -------
+    bool
+        True quando o PDF foi gerado.
+    """
+    render_docx_template(tpl_path, ctx, docx_out)
+    try:
+        size_docx = os.stat(docx_out).st_size
+    except OSError:
+        size_docx = -1
+    logger.info("[DFD] DOCX gerado | path=%s | size=%d", docx_out, size_docx)
+    return convert_docx_to_pdf(docx_out, pdf_out)
+
+
+async def _process_submission(sid: str, raw: Dict[str, Any], actor: Dict[str, Any]) -> None:
     """
     Pipeline assíncrono de processamento:
     1) Marca a submissão como `running` e audita.
-    2) Renderiza o DOCX e tenta converter para PDF.
+    2) Renderiza o DOCX e tenta converter para PDF (em `_render_pool`, fora do
+       processo do BFF, com limite de `DFD_RENDER_TIMEOUT_S`).
     3) Atualiza submissão com os caminhos/nome dos arquivos e audita `completed`.
     4) Em caso de erro, marca `error` e audita `failed`.
+
+    `raw` é o payload já validado por `DfdIn` e serializado (por alias) em
+    `submit_dfd` — o mesmo dict gravado em `submissions.payload`.
+
+    Roda no event loop (BackgroundTasks aguarda corrotinas diretamente): gravações
+    no banco vão para `asyncio.to_thread` e a renderização para o pool de
+    processos, então nenhuma thread do threadpool fica presa durante o LibreOffice.
     """
     def _cap_eventos_total(raw_obj: Dict[str, Any]) -> float:
         ce = raw_obj.get("capEventos") or {}
@@ -1119,22 +1343,21 @@ def _process_submission(sid: str, body: DfdIn, actor: Dict[str, Any]) -> None:
         }
 
     try:
-        update_submission(sid, status="running")
-        add_audit(KIND, "running", actor, {"sid": sid})
+        await asyncio.to_thread(update_submission, sid, status="running")
+        await asyncio.to_thread(add_audit, KIND, "running", actor, {"sid": sid})
     except Exception as e:
         logger.exception("update to running failed")
         try:
-            update_submission(sid, status="error", error=f"storage: {e}")
+            await asyncio.to_thread(update_submission, sid, status="error", error=f"storage: {e}")
         except Exception:
             pass
         try:
-            add_audit(KIND, "failed", actor, {"sid": sid, "error": f"storage: {e}"})
+            await asyncio.to_thread(add_audit, KIND, "failed", actor, {"sid": sid, "error": f"storage: {e}"})
         except Exception:
             pass
         return
 
     try:
-        raw = body.model_dump(by_alias=True)
         tpl_path = _get_model_path(raw["modeloSlug"])
         if not tpl_path:
             raise RuntimeError(
@@ -1143,8 +1366,6 @@ def _process_submission(sid: str, body: DfdIn, actor: Dict[str, Any]) -> None:
             )
         logger.info("[DFD] Processando submissão %s | modelo=%s | tpl_path=%s", sid, raw["modeloSlug"], tpl_path)
 
-        out_dir = "/app/data/files/dfd"
-        os.makedirs(out_dir, exist_ok=True)
 
         numero_safe = _safe_comp(raw["numero"])
         slug_safe = _safe_comp(raw["modeloSlug"].lower())
@@ -1211,13 +1432,13 @@ def _process_submission(sid: str, body: DfdIn, actor: Dict[str, Any]) -> None:
         total_geral = 0.0
         for i, it in enumerate(itens_in, start=1):
             try:
-                item = Item(**it)
+                item = Item.model_validate(it)
                 item_dict = item.model_dump()
             except ValidationError as ve:
                 error_msg = f"Item {i}: {ve.errors()}"
                 try:
-                    update_submission(sid, status="error", error=error_msg)
-                    add_audit(KIND, "failed", actor, {"sid": sid, "error": f"item {i} invalid"})
+                    await asyncio.to_thread(update_submission, sid, status="error", error=error_msg)
+                    await asyncio.to_thread(add_audit, KIND, "failed", actor, {"sid": sid, "error": f"item {i} invalid"})
                 except Exception as audit_err:
                     logger.exception("[DFD] Erro ao auditar falha de item %d: %s", i, audit_err)
                 return
@@ -1298,26 +1519,25 @@ def _process_submission(sid: str, body: DfdIn, actor: Dict[str, Any]) -> None:
                 "cap_cursos_total": float(round(cap_cursos_total, 2)),
             })
 
-        try:
-            placeholders = get_docx_placeholders(tpl_path)
-            logger.info("[DFD] Placeholders detectados (%d): %s", len(placeholders), placeholders)
-        except Exception:
-            pass
+        if logger.isEnabledFor(logging.INFO):
+            try:
+                placeholders = await asyncio.to_thread(
+                    _placeholders_cached, tpl_path, os.stat(tpl_path).st_mtime_ns
+                )
+                logger.info("[DFD] Placeholders detectados (%d): %s", len(placeholders), placeholders)
+            except Exception:
+                pass
         logger.info("[DFD] Assunto final: %s", assunto_final)
 
-        docx_out = f"{out_dir}/{sid}.docx"
-        render_docx_template(tpl_path, ctx, docx_out)
-        try:
-            size_docx = os.path.getsize(docx_out)
-        except Exception:
-            size_docx = -1
-        logger.info("[DFD] DOCX gerado | path=%s | size=%d", docx_out, size_docx)
-
-        pdf_out = f"{out_dir}/{sid}.pdf"
+        docx_out = str(OUT_DIR / f"{sid}.docx")
+        pdf_out = str(OUT_DIR / f"{sid}.pdf")
         filename_docx = f"{base}_{today_iso}.docx"
         filename_pdf = f"{base}_{today_iso}.pdf"
 
-        pdf_ok = convert_docx_to_pdf(docx_out, pdf_out)
+        pdf_ok = await asyncio.wait_for(
+            _render_in_pool(tpl_path, ctx, docx_out, pdf_out),
+            timeout=DFD_RENDER_TIMEOUT_S,
+        )
         file_path = pdf_out if pdf_ok else docx_out
         filename = filename_pdf if pdf_ok else filename_docx
 
@@ -1332,8 +1552,9 @@ def _process_submission(sid: str, body: DfdIn, actor: Dict[str, Any]) -> None:
             "engine": f"{KIND}@{DFD_VERSION}",
             "assunto": assunto_final,
         }
-        update_submission(sid, status="done", result=result, error=None)
-        add_audit(
+        await asyncio.to_thread(update_submission, sid, status="done", result=result, error=None)
+        await asyncio.to_thread(
+            add_audit,
             KIND,
             "completed",
             actor,
@@ -1346,19 +1567,30 @@ def _process_submission(sid: str, body: DfdIn, actor: Dict[str, Any]) -> None:
         )
 
         try:
-            size_final = os.path.getsize(file_path)
-        except Exception:
+            size_final = os.stat(file_path).st_size
+        except OSError:
             size_final = -1
         logger.info("[DFD] Submissão %s finalizada | entregue=%s (%d bytes)", sid, filename, size_final)
 
+    except asyncio.TimeoutError:
+        msg = f"render timeout after {DFD_RENDER_TIMEOUT_S:g}s"
+        logger.error("[DFD] Submissão %s: %s", sid, msg)
+        try:
+            await asyncio.to_thread(update_submission, sid, status="error", error=msg)
+        except Exception:
+            pass
+        try:
+            await asyncio.to_thread(add_audit, KIND, "failed", actor, {"sid": sid, "error": msg})
+        except Exception:
+            pass
     except Exception as e:
         logger.exception("processing error")
         try:
-            update_submission(sid, status="error", error=str(e))
+            await asyncio.to_thread(update_submission, sid, status="error", error=str(e))
         except Exception:
             pass
         try:
-            add_audit(KIND, "failed", actor, {"sid": sid, "error": str(e)})
+            await asyncio.to_thread(add_audit, KIND, "failed", actor, {"sid": sid, "error": str(e)})
         except Exception:
             pass
 
@@ -1520,7 +1752,7 @@ async def submit_dfd(
 
 
     try:
-        payload = DfdIn(**raw)
+        payload = DfdIn.model_validate(raw)
     except ValidationError as ve:
         friendly = _format_validation_errors(ve)
         logger.info("[DFD] validation_error: %s", friendly)
@@ -1548,6 +1780,7 @@ async def submit_dfd(
         return err_json(500, code="storage_error", message="Falha ao verificar duplicidade.", details=str(e))
 
     sid = str(uuid4())
+    payload_dump = payload.model_dump(by_alias=True, exclude_none=True)
     sub = {
         "id": sid,
         "kind": KIND,
@@ -1555,7 +1788,7 @@ async def submit_dfd(
         "actor_cpf": user.get("cpf"),
         "actor_nome": user.get("nome"),
         "actor_email": user.get("email"),
-        "payload": payload.model_dump(by_alias=True, exclude_none=True),
+        "payload": payload_dump,
         "status": "queued",
         "result": None,
         "error": None,
@@ -1606,8 +1839,8 @@ async def submit_dfd(
         raw["numero"],
     )
 
-    background.add_task(_process_submission, sid, payload, user)
-    return {"submissionId": sid, "status": "queued"}
+    background.add_task(_process_submission, sid, payload_dump, user)
+    return ORJSONResponse({"submissionId": sid, "status": "queued"})
 
 
 @router.post("/submissions/{sid}/download")
@@ -1649,11 +1882,13 @@ async def download_result(
         result = _to_obj(row.get("result"), {})
         file_path = result.get("file_path")
         filename = result.get("filename") or f"dfd_{sid}.pdf"
-        if not file_path or not os.path.exists(file_path):
+        try:
+            st = os.stat(file_path) if file_path else None
+        except OSError:
+            st = None
+        if st is None:
             return err_json(410, code="file_not_found", message="Arquivo não está mais disponível.", details={"sid": sid})
-
-        with open(file_path, "rb") as f:
-            data = f.read()
+        size = st.st_size
 
         try:
             ext = (os.path.splitext(filename)[1] or "").lstrip(".").lower() or "auto"
@@ -1664,7 +1899,7 @@ async def download_result(
                 {
                     "sid": sid,
                     "filename": filename,
-                    "bytes": len(data),
+                    "bytes": size,
                     "fmt": ext,
                     "ip": (getattr(request.client, "host", None) if request and request.client else None),
                     "ua": (request.headers.get("user-agent") if request else None),
@@ -1674,11 +1909,7 @@ async def download_result(
             logger.exception("audit (download legacy) failed (non-blocking)")
 
         media_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
-        return StreamingResponse(
-            BytesIO(data),
-            media_type=media_type,
-            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-        )
+        return FileResponse(file_path, media_type=media_type, filename=filename, stat_result=st)
     except Exception as e:
         logger.exception("download error")
         return err_json(500, code="download_error", message="Falha ao preparar o download.", details=str(e))
@@ -1733,7 +1964,11 @@ async def download_result_fmt(
             file_path = result.get("file_path_docx") or result.get("file_path")
             filename = result.get("filename_docx") or (result.get("filename") or f"dfd_{sid}.docx")
 
-        if not file_path or not os.path.exists(file_path):
+        try:
+            st = os.stat(file_path) if file_path else None
+        except OSError:
+            st = None
+        if st is None:
             return err_json(
                 410,
                 code="file_not_found",
@@ -1741,8 +1976,7 @@ async def download_result_fmt(
                 details={"sid": sid, "fmt": fmt},
             )
 
-        with open(file_path, "rb") as f:
-            data = f.read()
+        size = st.st_size
 
         try:
             add_audit(
@@ -1752,7 +1986,7 @@ async def download_result_fmt(
                 {
                     "sid": sid,
                     "filename": filename,
-                    "bytes": len(data),
+                    "bytes": size,
                     "fmt": fmt,
                     "ip": (getattr(request.client, "host", None) if request and request.client else None),
                     "ua": (request.headers.get("user-agent") if request else None),
@@ -1762,11 +1996,7 @@ async def download_result_fmt(
             logger.exception("audit (download fmt) failed (non-blocking)")
 
         media_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
-        return StreamingResponse(
-            BytesIO(data),
-            media_type=media_type,
-            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-        )
+        return FileResponse(file_path, media_type=media_type, filename=filename, stat_result=st)
     except Exception as e:
         logger.exception("download fmt error")
         return err_json(500, code="download_error", message="Falha ao preparar o download.", details=str(e))
@@ -1783,7 +2013,7 @@ async def list_audits_admin(
     """
     try:
         rows = list_audits(kind=KIND, limit=limit, offset=offset)
-        return {"items": rows, "limit": limit, "offset": offset}
+        return ORJSONResponse({"items": rows, "limit": limit, "offset": offset})
     except Exception as e:
         logger.exception("list_audits storage error")
         return err_json(500, code="storage_error", message="Falha ao consultar auditoria.", details=str(e))
@@ -1799,29 +2029,11 @@ async def dfd_ui(request: Request):
     try:
         checker(request)
     except HTTPException as he:
-        status = he.status_code
-        msg = "Faça login para acessar esta automação." if status == 401 else "Você não tem permissão para acessar esta automação."
-        html_err = f"""<!doctype html><meta charset="utf-8"/><title>Acesso</title>
-        <div style="font-family:system-ui;padding:24px">
-          <h1 style="margin:0 0 8px">{status}</h1>
-          <p style="color:#334155">{msg}</p>
-        </div>"""
-        return HTMLResponse(html_err, status_code=status)
+        return HTMLResponse(_access_error_page(he.status_code), status_code=he.status_code)
 
     if not is_dfd_accepting():
-        msg = dfd_closed_message()
-        html_closed = f"""<!doctype html><html lang=\"pt-BR\"><meta charset=\"utf-8\"/>
-<title>DFD indisponível</title>
-<div style=\"font-family:system-ui;padding:24px;max-width:720px;margin:0 auto\">
-  <div style=\"border:1px solid #e2e8f0;border-radius:14px;padding:16px;background:#fff\">
-    <h1 style=\"margin:0 0 8px;font-size:18px\">DFD temporariamente indisponível</h1>
-    <p style=\"margin:0;color:#334155;line-height:1.4\">{msg}</p>
-    <p style=\"margin:12px 0 0;color:#64748b;font-size:12px\">Se necessário, contate a Coordenadoria Administrativa.</p>
-  </div>
-</div></html>"""
-        return HTMLResponse(html_closed, status_code=200)
-    html = _read_html("ui.html")
-    return HTMLResponse(html)
+        return HTMLResponse(_closed_page(dfd_closed_message()), status_code=200)
+    return _html_page_response(request, "ui.html")
 
 
 @router.get("/ui/history")
@@ -1834,13 +2046,5 @@ async def dfd_history_ui(request: Request):
     try:
         checker(request)
     except HTTPException as he:
-        status = he.status_code
-        msg = "Faça login para acessar esta automação." if status == 401 else "Você não tem permissão para acessar esta automação."
-        html_err = f"""<!doctype html><meta charset="utf-8"/><title>Acesso</title>
-        <div style="font-family:system-ui;padding:24px">
-          <h1 style="margin:0 0 8px">{status}</h1>
-          <p style="color:#334155">{msg}</p>
-        </div>"""
-        return HTMLResponse(html_err, status_code=status)
-    html = _read_html("history.html")
-    return HTMLResponse(html)
+        return HTMLResponse(_access_error_page(he.status_code), status_code=he.status_code)
+    return _html_page_response(request, "history.html")
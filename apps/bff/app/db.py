@@ -12,11 +12,14 @@ Propósito
   • fileshare_items (metadados de arquivos temporários).
 - Expor helpers de CRUD e consultas frequentes (lista/obter/atualizar).
 - Oferecer utilitários para JSON (psycopg.Json) e horários (UTC).
+- Oferecer variantes assíncronas (`*_async`) das consultas de leitura mais
+  quentes, sobre um pool `psycopg_pool.AsyncConnectionPool`.
 
 Referência
 ----------
 - Banco de dados: PostgreSQL (psycopg 3).
-- Serialização JSON: psycopg.types.json.Json (para colunas JSONB).
+- Serialização JSON: psycopg.types.json.Json (para colunas JSONB); a leitura de
+  JSON/JSONB é decodificada com orjson (registrado globalmente no psycopg).
 - Horário: timezone-aware (UTC) para timestamps de sistema.
 
 Segurança & Efeitos colaterais
@@ -32,20 +35,26 @@ Observações
 """
 
 import os
+import re
 import json
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional
 from uuid import uuid4
 from pathlib import Path
 from datetime import datetime, timezone
 
+import orjson
 import psycopg
 from psycopg.rows import dict_row
-from psycopg.types.json import Json
+from psycopg.types.json import Json, set_json_loads
+from psycopg_pool import AsyncConnectionPool
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL não configurada para Postgres")
 
+set_json_loads(orjson.loads)
+
 
 def _pg():
     """
@@ -77,13 +86,54 @@ def _pg_tx():
     return psycopg.connect(DATABASE_URL, autocommit=False, row_factory=dict_row)
 
 
+DB_ASYNC_POOL_MIN_SIZE = int(os.getenv("DB_ASYNC_POOL_MIN_SIZE", "4"))
+DB_ASYNC_POOL_MAX_SIZE = int(os.getenv("DB_ASYNC_POOL_MAX_SIZE", "32"))
+
+_ASYNC_POOL = AsyncConnectionPool(
+    DATABASE_URL,
+    min_size=DB_ASYNC_POOL_MIN_SIZE,
+    max_size=DB_ASYNC_POOL_MAX_SIZE,
+    kwargs={"autocommit": True, "row_factory": dict_row},
+    open=False,
+)
+
+
+async def open_async_pool() -> None:
+    """
+    Abre o pool assíncrono de conexões (chamado no startup da aplicação).
+    """
+    await _ASYNC_POOL.open()
+
+
+async def close_async_pool() -> None:
+    """
+    Fecha o pool assíncrono de conexões (chamado no shutdown da aplicação).
+    """
+    await _ASYNC_POOL.close()
+
+
+def _pg_async():
+    """
+    Empresta uma conexão assíncrona do pool (autocommit, `dict_row`).
+
+    Uso
+    ---
+    `async with _pg_async() as conn, conn.cursor() as cur: ...`
+    """
+    return _ASYNC_POOL.connection()
+
+
 def init_db() -> None:
     """
     Cria tabelas e índices idempotentes (IF NOT EXISTS) e garante:
     - submissions: índices por data, kind, ator e status; trigger de `updated_at`;
       CHECK de `status` em {'queued','running','done','error'};
-      índices GIN para JSONB (payload/result) e índices por expressão.
-    - automation_audits: índice por timestamp.
+      índices GIN para JSONB (payload/result) e índices por expressão
+      (inclusive parcial de soft delete).
+    - automation_audits: `kind` normalizado (backfill único, feito junto
+      com a criação do CHECK `chk_automation_audits_kind_norm`); índices por (at, id), (kind, at, id), (kind, action)
+      e trigram de `actor_nome`, `actor_cpf` e dígitos do CPF (quando
+      `pg_trgm` estiver disponível), cobrindo todos os ramos do filtro `username`.
     - fileshare_items: índices por criação, expiração, dono e deleted_at.
     """
     sql = """
@@ -137,7 +187,49 @@ def init_db() -> None:
     CREATE INDEX IF NOT EXISTS ix_submissions_kind_actor_email_created
       ON submissions (kind, actor_email, created_at DESC);
 
-    CREATE INDEX IF NOT EXISTS ix_automation_audits_at ON automation_audits (at DESC);
+    DO $$
+    BEGIN
+      IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conname = 'chk_automation_audits_kind_norm'
+        AND conrelid = 'automation_audits'::regclass
+      ) THEN
+        UPDATE automation_audits
+           SET kind = regexp_replace(lower(btrim(kind)), '^automations/', '')
+         WHERE kind <> regexp_replace(lower(btrim(kind)), '^automations/', '');
+        ALTER TABLE automation_audits
+          ADD CONSTRAINT chk_automation_audits_kind_norm
+          CHECK (kind = lower(btrim(kind)) AND kind NOT LIKE 'automations/%');
+      END IF;
+    END$$;
+
+    DROP INDEX IF EXISTS ix_automation_audits_at;
+    CREATE INDEX IF NOT EXISTS ix_automation_audits_at_id ON automation_audits (at DESC, id DESC);
+    CREATE INDEX IF NOT EXISTS ix_automation_audits_kind_action ON automation_audits (kind, action);
+    CREATE INDEX IF NOT EXISTS ix_automation_audits_kind_at_id ON automation_audits (kind, at DESC, id DESC);
+
+    DO $$
+    BEGIN
+      CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    EXCEPTION WHEN insufficient_privilege THEN
+      RAISE NOTICE 'pg_trgm indisponível; índices trigram não serão criados';
+    END$$;
+
+    DO $$
+    BEGIN
+      IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') THEN
+        EXECUTE 'CREATE INDEX IF NOT EXISTS ix_automation_audits_actor_nome_trgm
+                   ON automation_audits USING GIN (actor_nome gin_trgm_ops)';
+        EXECUTE 'CREATE INDEX IF NOT EXISTS ix_automation_audits_actor_cpf_trgm
+                   ON automation_audits USING GIN (actor_cpf gin_trgm_ops)';
+        EXECUTE 'CREATE INDEX IF NOT EXISTS ix_automation_audits_cpf_digits_trgm
+                   ON automation_audits USING GIN ((regexp_replace(actor_cpf, ''\\D'', '''', ''g'')) gin_trgm_ops)';
+        EXECUTE 'CREATE INDEX IF NOT EXISTS ix_submissions_actor_nome_trgm
+                   ON submissions USING GIN (actor_nome gin_trgm_ops)';
+        EXECUTE 'CREATE INDEX IF NOT EXISTS ix_submissions_actor_email_trgm
+                   ON submissions USING GIN (actor_email gin_trgm_ops)';
+      END IF;
+    END$$;
 
     CREATE INDEX IF NOT EXISTS ix_fileshare_created_at ON fileshare_items (created_at DESC);
     CREATE INDEX IF NOT EXISTS ix_fileshare_expires_at ON fileshare_items (expires_at DESC);
@@ -176,6 +268,10 @@ def init_db() -> None:
     CREATE INDEX IF NOT EXISTS ix_submissions_kind_payload_protocolo
       ON submissions (kind, (payload->>'protocolo'));
 
+    CREATE INDEX IF NOT EXISTS ix_submissions_soft_deleted
+      ON submissions ((result->'_soft_delete'->>'deleted'), created_at DESC)
+      WHERE result ? '_soft_delete';
+
 
     -- NOTIFICAÇÕES (inbox)
     CREATE TABLE IF NOT EXISTS notifications (
@@ -482,6 +578,36 @@ def get_submission(id: str) -> Optional[Dict[str, Any]]:
         return dict(row) if row else None
 
 
+_SUBMISSION_BULK_COLUMNS_SQL = "id, kind, status, payload, result"
+
+
+def get_submissions_bulk(ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Recupera várias submissões em uma única consulta (`id = ANY(...)`).
+
+    Traz apenas `id`, `kind`, `status`, `payload` e `result` (o necessário para
+    enriquecer listagens); para a linha completa use `get_submission`.
+
+    Parâmetros
+    ----------
+    ids : Iterable[str]
+        Identificadores (duplicados/vazios são ignorados).
+
+    Retorna
+    -------
+    dict[str, dict]
+        Mapa `id -> linha`; ids inexistentes simplesmente não aparecem.
+    """
+    unique = list({i for i in ids if i})
+    if not unique:
+        return {}
+    with _pg() as conn, conn.cursor() as cur:
+        cur.execute(
+            f"SELECT {_SUBMISSION_BULK_COLUMNS_SQL} FROM submissions WHERE id = ANY(%s)", (unique,)
+        )
+        return {r["id"]: dict(r) for r in cur.fetchall() or []}
+
+
 def list_submissions(
     kind: Optional[str] = None,
     actor_cpf: Optional[str] = None,
@@ -539,12 +665,67 @@ def list_submissions(
         return [dict(r) for r in rows]
 
 
+def _submissions_admin_where(
+    kind: Optional[str],
+    username: Optional[str],
+    status: Optional[str],
+    exclude_deleted: bool = False,
+) -> tuple[List[str], List[Any]]:
+    """
+    Monta as cláusulas WHERE (e parâmetros) comuns às listagens administrativas
+    de submissões.
+    """
+    where: List[str] = ["1=1"]
+    params: List[Any] = []
+    if exclude_deleted:
+        where.append(f"NOT {_SUBMISSION_SOFT_DELETED_SQL}")
+    if kind:
+        where.append("kind = %s")
+        params.append(kind)
+    if status:
+        where.append("LOWER(status) = LOWER(%s)")
+        params.append(status)
+    if username:
+        where.append("("
+                     "actor_nome ILIKE %s OR "
+                     "actor_email ILIKE %s OR "
+                     "actor_cpf LIKE %s"
+                     ")")
+        term = f"%{username}%"
+        params.extend([term, term, f"%{username}%"])
+    return where, params
+
+
+def _list_submissions_admin_query(
+    kind: Optional[str],
+    username: Optional[str],
+    status: Optional[str],
+    limit: int,
+    offset: int,
+    exclude_deleted: bool = False,
+) -> tuple[str, List[Any]]:
+    """
+    Monta o SQL (e parâmetros) de `list_submissions_admin`/`iter_submissions_admin`.
+    """
+    where, params = _submissions_admin_where(kind, username, status, exclude_deleted)
+    sql = f"""
+        SELECT *
+        FROM submissions
+        WHERE {' AND '.join(where)}
+        ORDER BY created_at DESC
+        LIMIT %s OFFSET %s
+    """
+    params.extend([limit, offset])
+    return sql, params
+
+
 def list_submissions_admin(
     kind: Optional[str] = None,
     username: Optional[str] = None,
     status: Optional[str] = None,
     limit: int = 100,
     offset: int = 0,
+    exclude_deleted: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     Lista submissões para uso administrativo (sem exigir actor_*).
@@ -561,43 +742,250 @@ def list_submissions_admin(
         Quantidade de registros (padrão 100).
     offset : int
         Deslocamento para paginação.
+    exclude_deleted : bool
+        Quando verdadeiro, descarta submissões marcadas como soft delete.
 
     Retorna
     -------
     list[dict]
     """
-    where: List[str] = ["1=1"]
-    params: List[Any] = []
-    if kind:
-        where.append("kind = %s")
-        params.append(kind)
+    sql, params = _list_submissions_admin_query(
+        kind, username, status, limit, offset, exclude_deleted
+    )
+    with _pg() as conn, conn.cursor() as cur:
+        cur.execute(sql, params)
+        rows = cur.fetchall() or []
+        return [dict(r) for r in rows]
+
+
+def iter_submissions_admin(
+    kind: Optional[str] = None,
+    username: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = 100,
+    offset: int = 0,
+    exclude_deleted: bool = False,
+    itersize: int = 500,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Itera as mesmas linhas de `list_submissions_admin` via cursor do lado do servidor.
+
+    As linhas chegam do Postgres em lotes de `itersize`, de modo que cargas grandes
+    podem ser processadas à medida que chegam, sem materializar a lista inteira.
+    """
+    sql, params = _list_submissions_admin_query(
+        kind, username, status, limit, offset, exclude_deleted
+    )
+    with _pg() as conn:
+        with conn.transaction():
+            with conn.cursor(name="submissions_admin_iter") as cur:
+                cur.itersize = itersize
+                cur.execute(sql, params)
+                for row in cur:
+                    yield dict(row)
+
+
+_SUBMISSION_SOFT_DELETED_SQL = (
+    "(result ? '_soft_delete' "
+    "AND COALESCE(result->'_soft_delete'->>'deleted', '') NOT IN ('', 'false', '0'))"
+)
+_SUBMISSION_LOGICAL_STATUS_SQL = (
+    f"CASE WHEN {_SUBMISSION_SOFT_DELETED_SQL} THEN 'deleted' "
+    "ELSE COALESCE(NULLIF(btrim(result->>'status'), ''), status) END"
+)
+
+
+def _submissions_admin_lite_where(
+    kind: Optional[str],
+    username: Optional[str],
+    status: Optional[str],
+    since: Optional[datetime],
+    until: Optional[datetime],
+) -> tuple[List[str], List[Any]]:
+    """
+    Cláusulas WHERE (e parâmetros) da listagem enxuta: filtros de
+    `_submissions_admin_where`, status lógico e intervalo sobre `created_at`.
+    """
+    where, params = _submissions_admin_where(kind, username, None)
     if status:
-        where.append("LOWER(status) = LOWER(%s)")
-        params.append(status)
-    if username:
-        where.append("("
-                     "actor_nome ILIKE %s OR "
-                     "actor_email ILIKE %s OR "
-                     "actor_cpf LIKE %s"
-                     ")")
-        term = f"%{username}%"
-        params.extend([term, term, f"%{username}%"])
+        if status.strip().lower() == "deleted":
+            where.append(_SUBMISSION_SOFT_DELETED_SQL)
+        else:
+            where.append(f"LOWER({_SUBMISSION_LOGICAL_STATUS_SQL}) = LOWER(%s)")
+            params.append(status.strip())
+    if since:
+        where.append("created_at >= %s")
+        params.append(since)
+    if until:
+        where.append("created_at <= %s")
+        params.append(until)
+    return where, params
+
+
+_SUBMISSION_LITE_COLUMNS_SQL = f"""
+    id, kind, status, actor_nome, actor_cpf, actor_email, error,
+    created_at, updated_at,
+    {_SUBMISSION_LOGICAL_STATUS_SQL} AS logical_status
+"""
+
+_SUBMISSION_API_COLUMNS_SQL = f"""
+    id,
+    kind,
+    {_SUBMISSION_LOGICAL_STATUS_SQL} AS status,
+    COALESCE(NULLIF(actor_nome, ''), NULLIF(actor_cpf, ''), NULLIF(actor_email, '')) AS username,
+    NULLIF(actor_cpf, '') AS user_id,
+    created_at,
+    updated_at,
+    error
+"""
+
+_SUBMISSION_JSON_COLUMNS_SQL = """,
+    COALESCE(payload, '{}'::jsonb) AS payload,
+    COALESCE(result, '{}'::jsonb) AS result
+"""
+
 
+def _list_submissions_admin_lite_query(
+    kind: Optional[str],
+    username: Optional[str],
+    status: Optional[str],
+    limit: int,
+    offset: int,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    as_api_shape: bool = False,
+    with_payload: bool = False,
+) -> tuple[str, List[Any]]:
+    """
+    Monta o SQL (e parâmetros) de `list_submissions_admin_lite` e da variante assíncrona.
+    """
+    where, params = _submissions_admin_lite_where(kind, username, status, since, until)
+    columns = _SUBMISSION_API_COLUMNS_SQL if as_api_shape else _SUBMISSION_LITE_COLUMNS_SQL
+    if with_payload:
+        columns += _SUBMISSION_JSON_COLUMNS_SQL
     sql = f"""
-        SELECT *
+        SELECT {columns}
         FROM submissions
         WHERE {' AND '.join(where)}
         ORDER BY created_at DESC
         LIMIT %s OFFSET %s
     """
     params.extend([limit, offset])
+    return sql, params
+
+
+def _count_submissions_admin_lite_query(
+    kind: Optional[str],
+    username: Optional[str],
+    status: Optional[str],
+    since: Optional[datetime],
+    until: Optional[datetime],
+) -> tuple[str, List[Any]]:
+    """
+    Monta o SQL (e parâmetros) de `count_submissions_admin_lite` e da variante assíncrona.
+    """
+    where, params = _submissions_admin_lite_where(kind, username, status, since, until)
+    return f"SELECT COUNT(*) AS n FROM submissions WHERE {' AND '.join(where)}", params
+
+
+def list_submissions_admin_lite(
+    kind: Optional[str] = None,
+    username: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = 100,
+    offset: int = 0,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    as_api_shape: bool = False,
+    with_payload: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Variante enxuta de `list_submissions_admin` para listagens: não traz
+    `payload`/`result` e já devolve o status lógico calculado no SQL.
+
+    Status lógico
+    -------------
+    - `deleted` quando `result._soft_delete.deleted` é verdadeiro;
+    - senão `result.status` (quando preenchido);
+    - senão a coluna `status`.
+    O filtro `status` é aplicado sobre esse status lógico; `status=deleted`
+    usa o índice parcial de soft delete. `since`/`until` filtram `created_at`.
+
+    Parâmetros
+    ----------
+    as_api_shape : bool
+        Quando verdadeiro, projeta no próprio SQL o formato do painel de controle
+        (`status` lógico, `username`, `user_id`) em vez das colunas cruas.
+    with_payload : bool
+        Quando verdadeiro, inclui também `payload`/`result` (`{}` quando nulos).
 
+    Retorna
+    -------
+    list[dict]
+        Colunas escalares de `submissions` + `logical_status` (ou o formato de API).
+    """
+    sql, params = _list_submissions_admin_lite_query(
+        kind, username, status, limit, offset,
+        since=since, until=until, as_api_shape=as_api_shape, with_payload=with_payload,
+    )
     with _pg() as conn, conn.cursor() as cur:
         cur.execute(sql, params)
         rows = cur.fetchall() or []
         return [dict(r) for r in rows]
 
 
+def count_submissions_admin_lite(
+    kind: Optional[str] = None,
+    username: Optional[str] = None,
+    status: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> int:
+    """
+    Conta as submissões que atendem aos mesmos filtros de `list_submissions_admin_lite`.
+    """
+    sql, params = _count_submissions_admin_lite_query(kind, username, status, since, until)
+    with _pg() as conn, conn.cursor() as cur:
+        cur.execute(sql, params)
+        row = cur.fetchone()
+        return int(row["n"]) if row else 0
+
+
+def submissions_version(kind: str) -> tuple[int, Optional[datetime]]:
+    """
+    Retorna uma "versão" barata das submissões de um `kind`, para uso como chave
+    de cache: `(quantidade, maior updated_at)`.
+
+    Observação
+    ----------
+    Inserções e atualizações movem `updated_at` (trigger `touch_updated_at`);
+    exclusões físicas alteram a contagem.
+    """
+    sql = """
+        SELECT COUNT(*) AS n, MAX(updated_at) AS last
+        FROM submissions
+        WHERE kind = %s
+    """
+    with _pg() as conn, conn.cursor() as cur:
+        cur.execute(sql, (kind,))
+        row = cur.fetchone()
+        if not row:
+            return 0, None
+        return int(row["n"]), row["last"]
+
+
+def normalize_audit_kind(kind: Optional[str]) -> str:
+    """
+    Normaliza o `kind` gravado em `automation_audits`: sem espaços nas pontas,
+    minúsculo e sem o prefixo `automations/` (mesma regra do CHECK
+    `chk_automation_audits_kind_norm`).
+    """
+    k = str(kind or "").strip().lower()
+    if k.startswith("automations/"):
+        k = k.split("/", 1)[1]
+    return k
+
+
 def add_audit(kind: str, action: str, actor: Dict[str, Any], meta: Dict[str, Any]) -> None:
     """
     Registra um evento de auditoria em `automation_audits`.
@@ -612,7 +1000,12 @@ def add_audit(kind: str, action: str, actor: Dict[str, Any], meta: Dict[str, Any
         Dados do ator (cpf, nome/name).
     meta : dict
         Metadados adicionais serializados como JSONB.
+
+    Observação
+    ----------
+    `kind` é normalizado na escrita (`normalize_audit_kind`).
     """
+    kind = normalize_audit_kind(kind)
     with _pg() as conn, conn.cursor() as cur:
         cur.execute(
             """
@@ -627,6 +1020,7 @@ def add_audit(kind: str, action: str, actor: Dict[str, Any], meta: Dict[str, Any
                 _to_json_value(meta),
             ),
         )
+    _audit_distinct_touch(kind, action)
 
 
 def audit_log(actor: Dict[str, Any], action: str, kind: str, target_id: Optional[str] = None, meta: Optional[Dict[str, Any]] = None) -> None:
@@ -652,9 +1046,136 @@ def audit_log(actor: Dict[str, Any], action: str, kind: str, target_id: Optional
     add_audit(kind=kind, action=action, actor=actor, meta=m)
 
 
-def list_audits(kind: Optional[str] = None, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+_NON_DIGITS_RE = re.compile(r"\D+")
+
+# Formato das APIs de auditoria (`AuditOut` do painel de controle). Campos que a
+# tabela não possui (`user_id`, `target_id`, `ip`, `user_agent`) vêm nulos.
+_AUDIT_API_COLUMNS_SQL = """
+    id,
+    at AS ts,
+    NULL::text AS user_id,
+    COALESCE(NULLIF(actor_nome, ''), NULLIF(actor_cpf, '')) AS username,
+    action,
+    kind AS target_kind,
+    NULL::text AS target_id,
+    NULL::text AS ip,
+    NULL::text AS user_agent,
+    COALESCE(meta, '{}'::jsonb) AS extra
+"""
+
+
+def _audits_where(
+    kind: Optional[str],
+    username: Optional[str],
+    action: Optional[str],
+    since: Optional[datetime],
+    until: Optional[datetime],
+) -> tuple[List[str], List[Any]]:
+    """
+    Monta as cláusulas WHERE (e parâmetros) comuns às consultas de auditoria.
+
+    Filtros
+    -------
+    - `kind`: igualdade com a coluna (já gravada normalizada) ou com
+      `meta->>'kind'` normalizado — audits gravados sob outro kind que apontam
+      para uma submissão desse kind continuam aparecendo.
+    - `username`: substring em nome/CPF; quando houver dígitos, também casa
+      com o CPF só-dígitos (índice trigram `ix_automation_audits_cpf_digits_trgm`).
+    - `action`: substring (case-insensitive).
+    - `since`/`until`: intervalo fechado sobre `at`.
+    """
+    where: List[str] = ["1=1"]
+    params: List[Any] = []
+    if kind:
+        where.append("(kind = %s OR "
+                     "regexp_replace(lower(btrim(meta->>'kind')), '^automations/', '') = %s)")
+        params.extend([kind, kind])
+    term = (username or "").strip()
+    if term:
+        term_digits = _NON_DIGITS_RE.sub("", term)
+        if term_digits:
+            where.append("("
+                         "actor_nome ILIKE %s OR "
+                         "actor_cpf ILIKE %s OR "
+                         "regexp_replace(actor_cpf, '\\D', '', 'g') LIKE %s"
+                         ")")
+            params.extend([f"%{term}%", f"%{term}%", f"%{term_digits}%"])
+        else:
+            where.append("(actor_nome ILIKE %s OR actor_cpf ILIKE %s)")
+            params.extend([f"%{term}%", f"%{term}%"])
+    if action:
+        where.append("action ILIKE %s")
+        params.append(f"%{action}%")
+    if since:
+        where.append("at >= %s")
+        params.append(since)
+    if until:
+        where.append("at <= %s")
+        params.append(until)
+    return where, params
+
+
+def _list_audits_query(
+    kind: Optional[str],
+    limit: int,
+    offset: int,
+    as_api_shape: bool,
+    username: Optional[str] = None,
+    action: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    cursor: Optional[tuple[datetime, int]] = None,
+) -> tuple[str, List[Any]]:
+    """
+    Monta o SQL (e parâmetros) de `list_audits` / `list_audits_async`.
+
+    Com `cursor=(at, id)` a página é obtida por *keyset* (`(at, id) < cursor`)
+    e o `offset` é ignorado.
+    """
+    where, params = _audits_where(kind, username, action, since, until)
+    if cursor:
+        where.append("(at, id) < (%s, %s)")
+        params.extend(cursor)
+        offset = 0
+    columns = _AUDIT_API_COLUMNS_SQL if as_api_shape else "*"
+    sql = f"""
+        SELECT {columns} FROM automation_audits
+        WHERE {' AND '.join(where)}
+        ORDER BY at DESC, id DESC
+        LIMIT %s OFFSET %s
+    """
+    params.extend([limit, offset])
+    return sql, params
+
+
+def _count_audits_query(
+    kind: Optional[str],
+    username: Optional[str],
+    action: Optional[str],
+    since: Optional[datetime],
+    until: Optional[datetime],
+) -> tuple[str, List[Any]]:
     """
-    Lista eventos de auditoria.
+    Monta o SQL (e parâmetros) de `count_audits` / `count_audits_async`.
+    """
+    where, params = _audits_where(kind, username, action, since, until)
+    sql = f"SELECT COUNT(*) AS n FROM automation_audits WHERE {' AND '.join(where)}"
+    return sql, params
+
+
+def list_audits(
+    kind: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0,
+    as_api_shape: bool = False,
+    username: Optional[str] = None,
+    action: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    cursor: Optional[tuple[datetime, int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Lista eventos de auditoria (mais recentes primeiro).
 
     Parâmetros
     ----------
@@ -663,30 +1184,152 @@ def list_audits(kind: Optional[str] = None, limit: int = 50, offset: int = 0) ->
     limit : int
         Quantidade (padrão 50).
     offset : int
-        Deslocamento.
+        Deslocamento (ignorado quando `cursor` é informado).
+    as_api_shape : bool
+        Quando verdadeiro, renomeia as colunas no próprio SQL para o formato
+        usado pelas APIs de auditoria (`ts`, `username`, `target_kind`, `extra`).
+    username, action : str | None
+        Filtros textuais (ver `_audits_where`).
+    since, until : datetime | None
+        Intervalo temporal sobre `at`.
+    cursor : tuple[datetime, int] | None
+        Par `(at, id)` do último item da página anterior (paginação *keyset*).
 
     Retorna
     -------
     list[dict]
     """
+    sql, params = _list_audits_query(
+        kind, limit, offset, as_api_shape,
+        username=username, action=action, since=since, until=until, cursor=cursor,
+    )
+    with _pg() as conn, conn.cursor() as cur:
+        cur.execute(sql, params)
+        rows = cur.fetchall() or []
+        return [dict(r) for r in rows]
+
+
+def count_audits(
+    kind: Optional[str] = None,
+    username: Optional[str] = None,
+    action: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> int:
+    """
+    Conta os eventos de auditoria que atendem aos mesmos filtros de `list_audits`.
+    """
+    sql, params = _count_audits_query(kind, username, action, since, until)
+    with _pg() as conn, conn.cursor() as cur:
+        cur.execute(sql, params)
+        row = cur.fetchone()
+        return int(row["n"]) if row else 0
+
+
+AUDIT_DISTINCT_CACHE_TTL_SECONDS = float(os.getenv("AUDIT_DISTINCT_CACHE_TTL_SECONDS", "60"))
+_AUDIT_DISTINCT_CACHE: Dict[Any, Any] = {}
+_AUDIT_SEEN_PAIRS: set = set()
+
+
+def _audit_distinct_cached(key: Any, loader) -> List[str]:
+    """
+    Cache em memória (por processo, com TTL) para listas de valores distintos
+    de auditoria, que mudam pouco e são consultadas a cada abertura do painel.
+
+    A chave deve conter apenas valores simples (nunca objetos de request).
+    """
+    now = time.monotonic()
+    hit = _AUDIT_DISTINCT_CACHE.get(key)
+    if hit is not None and hit[0] > now:
+        return list(hit[1])
+    items = loader()
+    _AUDIT_DISTINCT_CACHE[key] = (now + AUDIT_DISTINCT_CACHE_TTL_SECONDS, tuple(items))
+    return items
+
+
+def clear_audit_distinct_cache() -> None:
+    """
+    Invalida o cache de valores distintos de auditoria.
+    """
+    _AUDIT_DISTINCT_CACHE.clear()
+
+
+def _audit_distinct_touch(kind: str, action: str) -> None:
+    """
+    Invalida o cache de distintos apenas quando o par (kind, action) ainda não
+    foi gravado por este processo; escritas repetidas não descartam o cache.
+    """
+    pair = (kind, action)
+    if pair not in _AUDIT_SEEN_PAIRS:
+        _AUDIT_SEEN_PAIRS.add(pair)
+        clear_audit_distinct_cache()
+
+
+def list_distinct_audit_actions(kind: Optional[str] = None) -> List[str]:
+    """
+    Lista as ações distintas registradas em `automation_audits`.
+
+    Parâmetros
+    ----------
+    kind : str | None
+        Filtro opcional por automação já normalizada (minúsculas, sem prefixo
+        `automations/`).
+
+    Retorna
+    -------
+    list[str]
+        Ações ordenadas alfabeticamente (sem valores vazios).
+
+    Observação
+    ----------
+    Resultado mantido em cache por `AUDIT_DISTINCT_CACHE_TTL_SECONDS` (padrão 60 s).
+    """
     params: List[Any] = []
-    where = ["1=1"]
+    where = ["btrim(action) <> ''"]
     if kind:
         where.append("kind = %s")
         params.append(kind)
-    where_sql = " AND ".join(where)
     sql = f"""
-        SELECT * FROM automation_audits
-        WHERE {where_sql}
-        ORDER BY at DESC
-        LIMIT %s OFFSET %s
+        SELECT DISTINCT btrim(action) AS action
+        FROM automation_audits
+        WHERE {' AND '.join(where)}
+        ORDER BY 1
     """
-    params.extend([limit, offset])
 
-    with _pg() as conn, conn.cursor() as cur:
-        cur.execute(sql, params)
-        rows = cur.fetchall() or []
-        return [dict(r) for r in rows]
+    def _load() -> List[str]:
+        with _pg() as conn, conn.cursor() as cur:
+            cur.execute(sql, params)
+            return [r["action"] for r in cur.fetchall() or []]
+
+    return _audit_distinct_cached(("actions", kind or None), _load)
+
+
+def list_distinct_audit_kinds() -> List[str]:
+    """
+    Lista os kinds distintos (normalizados) presentes em `automation_audits`.
+
+    Retorna
+    -------
+    list[str]
+        Kinds em minúsculas, sem prefixo `automations/`, ordenados.
+
+    Observação
+    ----------
+    Resultado mantido em cache por `AUDIT_DISTINCT_CACHE_TTL_SECONDS` (padrão 60 s).
+    """
+    sql = """
+        SELECT DISTINCT kind
+        FROM automation_audits
+        WHERE kind <> ''
+        ORDER BY 1
+    """
+
+    def _load() -> List[str]:
+        with _pg() as conn, conn.cursor() as cur:
+            cur.execute(sql)
+            return [r["kind"] for r in cur.fetchall() or []]
+
+    return _audit_distinct_cached(("kinds",), _load)
 
 
 def exists_submission_payload_value(kind: str, field: str, value: str) -> bool:
@@ -853,3 +1496,138 @@ def fileshare_cleanup_expired(limit: int = 200) -> int:
                 pass
             count += 1
         return count
+
+
+async def get_submission_async(id: str) -> Optional[Dict[str, Any]]:
+    """
+    Versão assíncrona de `get_submission` (usa o pool de `_pg_async`).
+    """
+    async with _pg_async() as conn, conn.cursor() as cur:
+        await cur.execute("SELECT * FROM submissions WHERE id = %s", (id,))
+        row = await cur.fetchone()
+        return dict(row) if row else None
+
+
+async def get_submissions_bulk_async(ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Versão assíncrona de `get_submissions_bulk` (usa o pool de `_pg_async`).
+    """
+    unique = list({i for i in ids if i})
+    if not unique:
+        return {}
+    async with _pg_async() as conn, conn.cursor() as cur:
+        await cur.execute(
+            f"SELECT {_SUBMISSION_BULK_COLUMNS_SQL} FROM submissions WHERE id = ANY(%s)", (unique,)
+        )
+        return {r["id"]: dict(r) for r in await cur.fetchall() or []}
+
+
+async def list_audits_async(
+    kind: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0,
+    as_api_shape: bool = False,
+    username: Optional[str] = None,
+    action: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    cursor: Optional[tuple[datetime, int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Versão assíncrona de `list_audits` (usa o pool de `_pg_async`).
+    """
+    sql, params = _list_audits_query(
+        kind, limit, offset, as_api_shape,
+        username=username, action=action, since=since, until=until, cursor=cursor,
+    )
+    async with _pg_async() as conn, conn.cursor() as cur:
+        await cur.execute(sql, params)
+        rows = await cur.fetchall() or []
+        return [dict(r) for r in rows]
+
+
+async def iter_audits_async(
+    kind: Optional[str] = None,
+    limit: int = 1000,
+    offset: int = 0,
+    username: Optional[str] = None,
+    action: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    itersize: int = 500,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Itera eventos de auditoria (no formato das APIs) via cursor do lado do servidor.
+
+    As linhas chegam do Postgres em lotes de `itersize`, de modo que exportações
+    grandes não precisam materializar a página inteira em memória.
+    """
+    sql, params = _list_audits_query(
+        kind, limit, offset, True,
+        username=username, action=action, since=since, until=until,
+    )
+    async with _pg_async() as conn:
+        async with conn.transaction():
+            async with conn.cursor(name="automation_audits_export") as cur:
+                cur.itersize = itersize
+                await cur.execute(sql, params)
+                async for row in cur:
+                    yield dict(row)
+
+
+async def count_audits_async(
+    kind: Optional[str] = None,
+    username: Optional[str] = None,
+    action: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> int:
+    """
+    Versão assíncrona de `count_audits` (usa o pool de `_pg_async`).
+    """
+    sql, params = _count_audits_query(kind, username, action, since, until)
+    async with _pg_async() as conn, conn.cursor() as cur:
+        await cur.execute(sql, params)
+        row = await cur.fetchone()
+        return int(row["n"]) if row else 0
+
+
+async def list_submissions_admin_lite_async(
+    kind: Optional[str] = None,
+    username: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = 100,
+    offset: int = 0,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    as_api_shape: bool = False,
+    with_payload: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Versão assíncrona de `list_submissions_admin_lite` (usa o pool de `_pg_async`).
+    """
+    sql, params = _list_submissions_admin_lite_query(
+        kind, username, status, limit, offset,
+        since=since, until=until, as_api_shape=as_api_shape, with_payload=with_payload,
+    )
+    async with _pg_async() as conn, conn.cursor() as cur:
+        await cur.execute(sql, params)
+        rows = await cur.fetchall() or []
+        return [dict(r) for r in rows]
+
+
+async def count_submissions_admin_lite_async(
+    kind: Optional[str] = None,
+    username: Optional[str] = None,
+    status: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> int:
+    """
+    Versão assíncrona de `count_submissions_admin_lite` (usa o pool de `_pg_async`).
+    """
+    sql, params = _count_submissions_admin_lite_query(kind, username, status, since, until)
+    async with _pg_async() as conn, conn.cursor() as cur:
+        await cur.execute(sql, params)
+        row = await cur.fetchone()
+        return int(row["n"]) if row else 0
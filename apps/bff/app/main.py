@@ -27,14 +27,16 @@ from typing import Any, Dict, Optional
 import psycopg
 from fastapi import FastAPI, Request, HTTPException, Query, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse, HTMLResponse
 from starlette.middleware.sessions import SessionMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from app.automations.dfd import AUTOMATION_META as DFD_META, DFD_VERSION as DFD_VER, router as dfd_router
+from app.automations.dfd import AUTOMATION_META as DFD_META, DFD_VERSION as DFD_VER, router as dfd_router, shutdown_render_pool
 from app.automations.etp import AUTOMATION_META as ETP_META, ETP_VERSION as ETP_VER, router as etp_router
 from app.automations.ferias import AUTOMATION_META as FERIAS_META, FERIAS_VERSION as FERIAS_VER, router as ferias_router
 from app.automations.ponto_saldo import AUTOMATION_META as PONTO_SALDO_META, PONTO_SALDO_VERSION as PONTO_SALDO_VER, router as ponto_saldo_router
-from app.db import init_db, DATABASE_URL
+from app.db import init_db, open_async_pool, close_async_pool, DATABASE_URL
 from app.automations.profile import AUTOMATION_META as PROFILE_META, PROFILE_VERSION as PROFILE_VER, router as profile_router
 from app.automations.form2json import AUTOMATION_META as FORM2JSON_META, FORM2JSON_VERSION as FORM2JSON_VER, router as form2json_router
 from app.automations.controle import AUTOMATION_META as CONTROLE_META, CONTROLE_VERSION as CONTROLE_VER, router as controle_router
@@ -116,6 +118,34 @@ AUTOMATION_VERSION_BY_KIND = {
 }
 
 
+# Rotas do painel de controle cujas respostas (listagens JSON e exports CSV/ICS)
+# compensam a compressão. Downloads de arquivos (PDF/DOCX/XLSX, já compactados)
+# ficam de fora.
+GZIP_PATH_PREFIXES = (
+    "/api/automations/controle/audits",
+    "/api/automations/controle/submissions",
+    "/api/automations/controle/ferias/events",
+)
+
+
+class PathGZipMiddleware:
+    """
+    Aplica `GZipMiddleware` apenas às requisições HTTP cujo `path` começa por
+    um dos `prefixes`; as demais seguem sem compressão.
+    """
+
+    def __init__(self, app: ASGIApp, prefixes: tuple[str, ...], minimum_size: int = 1024) -> None:
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+        self.prefixes = prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.prefixes):
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
 APP = FastAPI(title="Portal AGEPAR BFF", version="0.3.0", docs_url="/api/docs", redoc_url="/api/redoc")
 
 APP.add_middleware(
@@ -134,6 +164,8 @@ APP.add_middleware(
     https_only=False,
     session_cookie="portal_agepar_session",
 )
+# Compressão só das listagens/exports do painel de controle (ver `GZIP_PATH_PREFIXES`).
+APP.add_middleware(PathGZipMiddleware, prefixes=GZIP_PATH_PREFIXES, minimum_size=1024)
 
 APP.include_router(snake_router)
 APP.include_router(auth_router)
@@ -170,6 +202,31 @@ def _startup() -> None:
     start_weekly_task_email_scheduler()
 
 
+@APP.on_event("startup")
+async def _startup_async_pool() -> None:
+    """
+    Abre o pool assíncrono de conexões usado pelos endpoints `async` (ex.: controle).
+    """
+    await open_async_pool()
+    logger.info("Async DB pool opened")
+
+
+@APP.on_event("shutdown")
+async def _shutdown_async_pool() -> None:
+    """
+    Fecha o pool assíncrono de conexões no encerramento do aplicativo.
+    """
+    await close_async_pool()
+
+
+@APP.on_event("shutdown")
+def _shutdown_render_pool() -> None:
+    """
+    Encerra o pool de processos de renderização DOCX/PDF do DFD.
+    """
+    shutdown_render_pool()
+
+
 def _sync_catalog_block_metadata(block: Dict[str, Any]) -> None:
     kind = block.get("name")
     if not isinstance(kind, str):
@@ -985,6 +985,41 @@ def _soffice_bin() -> str | None:
     return shutil.which("soffice") or shutil.which("libreoffice")
 
 
+DOCX_UNOSERVER = (os.environ.get("DOCX_UNOSERVER") or "").strip()
+DOCX_UNOSERVER_TIMEOUT_S = float(os.environ.get("DOCX_UNOSERVER_TIMEOUT_S", "120"))
+DOCX_SOFFICE_TIMEOUT_S = float(os.environ.get("DOCX_SOFFICE_TIMEOUT_S", "120"))
+
+
+def _convert_via_unoserver(docx_path: str, pdf_path: str) -> bool:
+    """
+    Converte via um `unoserver` já em execução (LibreOffice residente), usando o
+    cliente `unoconvert`. Evita subir um `soffice` novo a cada conversão.
+
+    Só é usado quando `DOCX_UNOSERVER` (`host:porta`) está definido e o
+    `unoconvert` está no PATH; qualquer falha devolve False para que o chamador
+    recorra ao `soffice` local.
+    """
+    if not DOCX_UNOSERVER:
+        return False
+    unoconvert = shutil.which("unoconvert")
+    if not unoconvert:
+        return False
+    host, _, port = DOCX_UNOSERVER.rpartition(":")
+    if not host or not port:
+        host, port = DOCX_UNOSERVER, "2003"
+    os.makedirs(os.path.dirname(pdf_path), exist_ok=True)
+    try:
+        subprocess.run(
+            [unoconvert, "--host", host, "--port", port, "--convert-to", "pdf", docx_path, pdf_path],
+            check=True,
+            timeout=DOCX_UNOSERVER_TIMEOUT_S,
+        )
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+        logger.warning("[docx_tools] unoserver indisponível (%s); usando soffice local.", e)
+        return False
+    return os.path.exists(pdf_path)
+
+
 def has_soffice() -> bool:
     """
     Indica se o LibreOffice está disponível para conversão.
@@ -1016,8 +1051,16 @@ def convert_docx_to_pdf(docx_path: str, pdf_path: str) -> bool:
     Observações
     -----------
     - A conversão roda no diretório do DOCX, com saída direcionada a `outdir` do PDF.
-    - Em caso de erro de processo, registra log e retorna False.
+    - Cada processo usa um perfil próprio do LibreOffice (`UserInstallation` por PID),
+      para que conversões em processos paralelos não disputem o mesmo perfil.
+    - Com `DOCX_UNOSERVER` configurado, tenta antes o LibreOffice residente
+      (`_convert_via_unoserver`) e só cai no `soffice` por chamada se ele falhar.
+    - O `soffice` é encerrado após `DOCX_SOFFICE_TIMEOUT_S`, para que um LibreOffice
+      travado não prenda o processo chamador (ex.: worker do pool de render do DFD).
+    - Em caso de erro de processo ou timeout, registra log e retorna False.
     """
+    if _convert_via_unoserver(docx_path, pdf_path):
+        return True
     soffice = _soffice_bin()
     if not soffice:
         logger.info("[docx_tools] soffice não encontrado; ficará em DOCX.")
@@ -1025,15 +1068,21 @@ def convert_docx_to_pdf(docx_path: str, pdf_path: str) -> bool:
     outdir = os.path.dirname(pdf_path)
     os.makedirs(outdir, exist_ok=True)
     cwd = os.path.dirname(docx_path)
+    profile_dir = os.path.join(tempfile.gettempdir(), f"lo_profile_{os.getpid()}")
     try:
         subprocess.check_call(
             [
                 soffice, "--headless", "--norestore", "--invisible",
+                f"-env:UserInstallation=file://{profile_dir}",
                 "--convert-to", "pdf", os.path.basename(docx_path),
                 "--outdir", outdir
             ],
-            cwd=cwd
+            cwd=cwd,
+            timeout=DOCX_SOFFICE_TIMEOUT_S,
         )
+    except subprocess.TimeoutExpired:
+        logger.error("[docx_tools] LibreOffice excedeu %ss; conversão abortada.", DOCX_SOFFICE_TIMEOUT_S)
+        return False
     except subprocess.CalledProcessError as e:
         logger.error("[docx_tools] Erro LibreOffice: %s", e)
         return False
@@ -44,4 +44,4 @@ export CATALOG_FILE="${CATALOG_FILE:-/catalog/catalog.dev.json}"
 
 # OBS: DATABASE_URL deve vir do docker-compose/.env; não definimos default aqui.
 
-exec uvicorn app.main:APP --reload --host "$UVICORN_HOST" --port "$UVICORN_PORT"
+exec uvicorn app.main:APP --reload --loop uvloop --http httptools --host "$UVICORN_HOST" --port "$UVICORN_PORT"